@@ -5,8 +5,9 @@ import logging
 import os
 from dataclasses import dataclass
 from enum import Enum
+from functools import cached_property
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Union
+from typing import IO, Any, Dict, List, Mapping, Optional, Union
 
 from pydantic import BaseModel, Field, RootModel, validator
 
@@ -66,6 +67,11 @@ class MCPConfig(BaseModel):
     """Configuration for MCP servers."""
     
     mcp_servers: List[MCPServerConfig] = Field(default_factory=list)
+    
+    @cached_property
+    def servers_by_name(self) -> Dict[str, MCPServerConfig]:
+        """Get MCP server configs indexed by server name."""
+        return {server.name: server for server in self.mcp_servers}
 
 
 class ModelConfig(BaseModel):
@@ -163,15 +169,23 @@ class AppConfig(BaseModel):
         return v
 
 
-def load_config(config_path: Union[str, Path] = "config/config.json") -> AppConfig:
+def load_config(
+    config_path: Union[str, Path, IO[str], Mapping[str, Any]] = "config/config.json"
+) -> AppConfig:
     """Load configuration from a JSON file.
     
     Args:
-        config_path: Path to the configuration file
+        config_path: Path to the configuration file, an open JSON file, or
+            already-parsed configuration data
         
     Returns:
         Application configuration object
     """
+    if isinstance(config_path, Mapping):
+        return AppConfig(**config_path)
+    if hasattr(config_path, "read"):
+        return AppConfig(**json.load(config_path))
+    
     try:
         with open(config_path, "r") as f:
             config_data = json.load(f)
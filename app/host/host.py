@@ -9,7 +9,7 @@ from app.config.config import AppConfig, MCPServerConfig
 from app.host.client import MCPClient
 from app.model.model import ModelService
 from app.utils.model_mcp import (
-    create_mcp_system_prompt,
+    MCP_SYSTEM_PROMPT,
     extract_mcp_requests_from_text,
     format_mcp_results_for_model,
 )
@@ -90,7 +90,7 @@ class MCPHost:
         if not conversation_history:
             conversation_history.append({
                 "role": "system",
-                "content": create_mcp_system_prompt(),
+                "content": MCP_SYSTEM_PROMPT,
             })
         
         # Add user message to history
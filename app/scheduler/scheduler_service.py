@@ -20,13 +20,11 @@ from typing import Any, Dict, List, Optional, Union
 from app.config.config import load_config
 from app.host.mcp_client import MCPSdkClient
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
 logger = logging.getLogger(__name__)
 
+# Number of conversations scheduled by test_scheduler_service
+TEST_CONVERSATION_COUNT = 3
+
 
 class SchedulerService:
     """Wrapper for the Scheduler MCP service."""
@@ -47,27 +45,28 @@ class SchedulerService:
         Returns:
             True if initialization was successful, False otherwise
         """
+        # self.config is loaded once, so an open client is always current
+        if self.client:
+            return True
+        
         try:
             # Find the Scheduler configuration
-            scheduler_config = None
-            for server_config in self.config.mcp.mcp_servers:
-                if server_config.name == "Scheduler":
-                    scheduler_config = server_config
-                    break
+            scheduler_config = self.config.mcp.servers_by_name.get("Scheduler")
             
             if not scheduler_config:
                 logger.error("Scheduler configuration not found")
                 return False
             
-            # Initialize the client
-            self.client = MCPSdkClient(scheduler_config)
-            await self.client.initialize()
+            # Initialize the client, keeping it only once it is connected
+            client = MCPSdkClient(scheduler_config)
+            await client.initialize()
+            self.client = client
             
             logger.info("Scheduler service initialized successfully")
             return True
             
         except Exception as e:
-            logger.error(f"Error initializing scheduler service: {e}", exc_info=True)
+            logger.error("Error initializing scheduler service: %s", e, exc_info=True)
             return False
     
     async def close(self) -> None:
@@ -124,15 +123,15 @@ class SchedulerService:
             
             # Check if the call was successful
             if "error" in result:
-                logger.error(f"Error scheduling conversation: {result['error']}")
+                logger.error("Error scheduling conversation: %s", result['error'])
                 return None
             
             conversation_id = result.get("text")
-            logger.info(f"Scheduled conversation with ID: {conversation_id}")
+            logger.info("Scheduled conversation with ID: %s", conversation_id)
             return conversation_id
             
         except Exception as e:
-            logger.error(f"Error scheduling conversation: {e}", exc_info=True)
+            logger.error("Error scheduling conversation: %s", e, exc_info=True)
             return None
     
     async def get_conversation_status(self, conversation_id: str) -> Optional[str]:
@@ -158,15 +157,15 @@ class SchedulerService:
             
             # Check if the call was successful
             if "error" in result:
-                logger.error(f"Error getting conversation status: {result['error']}")
+                logger.error("Error getting conversation status: %s", result['error'])
                 return None
             
             status = result.get("text")
-            logger.info(f"Conversation status for {conversation_id}: {status}")
+            logger.info("Conversation status for %s: %s", conversation_id, status)
             return status
             
         except Exception as e:
-            logger.error(f"Error getting conversation status: {e}", exc_info=True)
+            logger.error("Error getting conversation status: %s", e, exc_info=True)
             return None
     
     async def cancel_conversation(self, conversation_id: str) -> bool:
@@ -191,19 +190,19 @@ class SchedulerService:
             
             # Check if the call was successful
             if "error" in result:
-                logger.error(f"Error cancelling conversation: {result['error']}")
+                logger.error("Error cancelling conversation: %s", result['error'])
                 return False
             
             success = result.get("text", "").lower() == "true"
             if success:
-                logger.info(f"Successfully cancelled conversation {conversation_id}")
+                logger.info("Successfully cancelled conversation %s", conversation_id)
             else:
-                logger.warning(f"Failed to cancel conversation {conversation_id}")
+                logger.warning("Failed to cancel conversation %s", conversation_id)
             
             return success
             
         except Exception as e:
-            logger.error(f"Error cancelling conversation: {e}", exc_info=True)
+            logger.error("Error cancelling conversation: %s", e, exc_info=True)
             return False
 
 
@@ -217,33 +216,55 @@ async def test_scheduler_service():
         return
     
     try:
-        # Schedule a test conversation for 5 minutes from now
+        # Schedule test conversations for 5 minutes from now; independent calls
+        # share the one MCP session, so they are issued concurrently
         scheduled_time = datetime.now() + timedelta(minutes=5)
-        conversation_id = await service.schedule_conversation(
-            conversation_text="This is a test scheduled message from the SchedulerService wrapper",
-            scheduled_time=scheduled_time,
-            endpoint="https://example.com/callback",
-            additional_info="Test from SchedulerService wrapper"
-        )
+        conversation_ids = await asyncio.gather(*(
+            service.schedule_conversation(
+                conversation_text=f"This is test scheduled message {i} from the SchedulerService wrapper",
+                scheduled_time=scheduled_time,
+                endpoint="https://example.com/callback",
+                additional_info="Test from SchedulerService wrapper"
+            )
+            for i in range(TEST_CONVERSATION_COUNT)
+        ))
+        conversation_ids = [cid for cid in conversation_ids if cid]
         
-        if conversation_id:
-            # Check the conversation status
-            status = await service.get_conversation_status(conversation_id)
-            if status:
-                logger.info(f"Conversation status: {status}")
-            
-            # Cancel the conversation
-            cancelled = await service.cancel_conversation(conversation_id)
-            logger.info(f"Conversation cancelled: {cancelled}")
-            
-            if cancelled:
-                # Check the status again to verify cancellation
-                status = await service.get_conversation_status(conversation_id)
-                logger.info(f"Conversation status after cancellation: {status}")
+        if conversation_ids:
+            # Check the conversation statuses
+            statuses = await asyncio.gather(
+                *(service.get_conversation_status(cid) for cid in conversation_ids)
+            )
+            for cid, status in zip(conversation_ids, statuses):
+                if status:
+                    logger.info("Conversation %s status: %s", cid, status)
+            
+            # Cancel the conversations
+            cancelled = await asyncio.gather(
+                *(service.cancel_conversation(cid) for cid in conversation_ids)
+            )
+            for cid, was_cancelled in zip(conversation_ids, cancelled):
+                logger.info("Conversation %s cancelled: %s", cid, was_cancelled)
+            
+            # Check the statuses again to verify cancellation
+            cancelled_ids = [
+                cid for cid, was_cancelled in zip(conversation_ids, cancelled)
+                if was_cancelled
+            ]
+            statuses = await asyncio.gather(
+                *(service.get_conversation_status(cid) for cid in cancelled_ids)
+            )
+            for cid, status in zip(cancelled_ids, statuses):
+                logger.info("Conversation %s status after cancellation: %s", cid, status)
         
     finally:
         await service.close()
 
 
 if __name__ == "__main__":
+    # Configure logging
+    logging.basicConfig(
+        level=logging.INFO,
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+    )
     asyncio.run(test_scheduler_service())
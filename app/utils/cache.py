@@ -3,7 +3,7 @@
 import functools
 import logging
 import time
-from typing import Any, Callable, Dict, Optional, TypeVar
+from typing import Any, Callable, Dict, Hashable, Optional, TypeVar
 
 logger = logging.getLogger(__name__)
 
@@ -12,7 +12,7 @@ T = TypeVar('T')
 R = TypeVar('R')
 
 # Simple in-memory cache
-_CACHE: Dict[str, Dict[str, Any]] = {}
+_CACHE: Dict[str, Dict[Hashable, Any]] = {}
 
 
 def timed_lru_cache(
@@ -45,8 +45,8 @@ def timed_lru_cache(
         @functools.wraps(func)
         def wrapper(*args: Any, **kwargs: Any) -> R:
             """Wrapper function that adds TTL to the cached items."""
-            # Generate a key for the current arguments
-            arg_key = str(args) + str(kwargs)
+            # Generate a key for the current arguments, as lru_cache does
+            arg_key = functools._make_key(args, kwargs, typed)
             
             # Check if the item exists in our TTL tracking
             now = time.time()
@@ -58,7 +58,7 @@ def timed_lru_cache(
                     # TTL expired, remove from cache and LRU cache
                     del item_cache[arg_key]
                     cached_func.cache_clear()
-                    logger.debug(f"Cache expired for {cache_key}({arg_key})")
+                    logger.debug("Cache expired for %s(%s)", cache_key, arg_key)
             
             # Call the LRU-cached function
             result = cached_func(*args, **kwargs)
@@ -76,7 +76,7 @@ def timed_lru_cache(
         # Define a custom method to clear specific keys
         def clear_key(*args: Any, **kwargs: Any) -> None:
             """Clear a specific key from the cache."""
-            arg_key = str(args) + str(kwargs)
+            arg_key = functools._make_key(args, kwargs, typed)
             if arg_key in _CACHE[cache_key]:
                 del _CACHE[cache_key][arg_key]
                 # We need to clear the entire LRU cache because we can't
@@ -1,36 +1,70 @@
 """Environment variable utilities."""
 
+import functools
 import logging
 import os
 from pathlib import Path
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from dotenv import load_dotenv
 
 logger = logging.getLogger(__name__)
 
+# Environment variables returned by load_env, with their defaults
+_ENV_DEFAULTS: Tuple[Tuple[str, Optional[str]], ...] = (
+    ("MODEL_ID", "deepseek-ai/DeepSeek-R1"),
+    ("USE_GPU", "0"),
+    ("API_HOST", "0.0.0.0"),
+    ("API_PORT", "8000"),
+    ("DATA_DIR", "./data"),
+    ("ANTHROPIC_API_KEY", None),
+    ("OPENAI_API_KEY", None),
+)
+
+# Loaded environments, keyed by the env_file argument to load_env
+_ENV_CACHE: Dict[Optional[str], Dict[str, str]] = {}
+
+
+@functools.lru_cache(maxsize=1)
+def _find_env_file() -> Optional[str]:
+    """Find the nearest .env file, walking up from the current directory.
+    
+    Returns:
+        Path to the .env file, or None if not found
+    """
+    start = Path.cwd()
+    for directory in (start, *start.parents):
+        candidate = directory / ".env"
+        if candidate.exists():
+            return str(candidate)
+    return None
+
+
+def clear_env_cache() -> None:
+    """Clear the cached .env location and loaded environment."""
+    _find_env_file.cache_clear()
+    _ENV_CACHE.clear()
+
 
 def load_env(env_file: Optional[str] = None) -> Dict[str, str]:
     """Load environment variables from .env file.
     
+    The result is cached; call clear_env_cache() to reload.
+    
     Args:
         env_file: Path to the .env file
         
     Returns:
         Dictionary of environment variables
     """
+    if env_file in _ENV_CACHE:
+        return dict(_ENV_CACHE[env_file])
+    
+    cache_key = env_file
+    
     # Try to find .env file if not specified
     if not env_file:
-        locations = [
-            ".env",
-            "../.env",
-            "../../.env",
-        ]
-        
-        for location in locations:
-            if Path(location).exists():
-                env_file = location
-                break
+        env_file = _find_env_file()
     
     # Load environment variables
     if env_file and Path(env_file).exists():
@@ -40,12 +74,7 @@ def load_env(env_file: Optional[str] = None) -> Dict[str, str]:
         logger.warning("No .env file found, using default environment variables")
     
     # Return a dictionary of relevant environment variables
-    return {
-        "MODEL_ID": os.environ.get("MODEL_ID", "deepseek-ai/DeepSeek-R1"),
-        "USE_GPU": os.environ.get("USE_GPU", "0"),
-        "API_HOST": os.environ.get("API_HOST", "0.0.0.0"),
-        "API_PORT": os.environ.get("API_PORT", "8000"),
-        "DATA_DIR": os.environ.get("DATA_DIR", "./data"),
-        "ANTHROPIC_API_KEY": os.environ.get("ANTHROPIC_API_KEY"),
-        "OPENAI_API_KEY": os.environ.get("OPENAI_API_KEY"),
-    }
+    env = {key: os.environ.get(key, default) for key, default in _ENV_DEFAULTS}
+    _ENV_CACHE[cache_key] = env
+    
+    return dict(env)
@@ -2,10 +2,48 @@
 
 import json
 import logging
+from dataclasses import dataclass, field
 from typing import Any, Dict, Optional
 
 logger = logging.getLogger(__name__)
 
+# Request types understood by MCP servers
+_VALID_TYPES = frozenset({"resource", "tool"})
+
+
+@dataclass(slots=True, frozen=True)
+class MCPRequest:
+    """An MCP request, validated at construction time."""
+    
+    type: str
+    server: str
+    name: str
+    params: Dict[str, Any] = field(default_factory=dict)
+    id: Optional[str] = None
+    
+    def __post_init__(self) -> None:
+        """Validate the request type."""
+        if self.type not in _VALID_TYPES:
+            raise ValueError(f"Invalid MCP request type: {self.type}")
+    
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the request to a dictionary.
+        
+        Returns:
+            MCP request dictionary, with ``id`` only present when set
+        """
+        request = {
+            "type": self.type,
+            "server": self.server,
+            "name": self.name,
+            "params": self.params,
+        }
+        
+        if self.id:
+            request["id"] = self.id
+        
+        return request
+
 
 def format_mcp_request(
     request_type: str,
@@ -25,18 +63,13 @@ def format_mcp_request(
         
     Returns:
         Formatted MCP request dictionary
+        
+    Raises:
+        ValueError: If the request type is not a valid MCP request type
     """
-    request = {
-        "type": request_type,
-        "server": server_name,
-        "name": name,
-        "params": params or {},
-    }
-    
-    if request_id:
-        request["id"] = request_id
-    
-    return request
+    return MCPRequest(
+        request_type, server_name, name, params or {}, request_id
+    ).to_dict()
 
 
 def parse_mcp_marker(text: str) -> Dict[str, Any]:
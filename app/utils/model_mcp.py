@@ -5,8 +5,54 @@ import logging
 import re
 from typing import Any, Dict, List, Optional, Tuple
 
+import orjson
+
 logger = logging.getLogger(__name__)
 
+_REQUIRED_FIELDS = ("type", "server", "name")
+_VALID_TYPES = frozenset({"resource", "tool"})
+
+# System prompt to guide the model in using MCP
+MCP_SYSTEM_PROMPT = """You are an assistant with access to external tools and data sources via the Model Context Protocol (MCP).
+
+When you need to access external information or use a tool, you can use the MCP format:
+
+```mcp
+{
+    "type": "resource",
+    "server": "WebScraper",
+    "name": "webpage",
+    "params": {
+        "url": "https://example.com"
+    }
+}
+```
+
+Or for tools:
+
+```mcp
+{
+    "type": "tool",
+    "server": "SearchEngine",
+    "name": "search",
+    "params": {
+        "query": "sample search query"
+    }
+}
+```
+
+Available MCP servers:
+- WebScraper: Access web content
+  - Resources: webpage
+  - Tools: extract_text, search_text
+
+- SearchEngine: Search for information
+  - Resources: search_results
+  - Tools: search
+
+First try to answer from your knowledge. If you need external information, use the appropriate MCP request.
+"""
+
 
 def extract_mcp_requests_from_text(text: str) -> Tuple[str, List[Dict[str, Any]]]:
     """Extract MCP requests from model output text.
@@ -28,6 +74,10 @@ def extract_mcp_requests_from_text(text: str) -> Tuple[str, List[Dict[str, Any]]
     Returns:
         Tuple of (cleaned text without MCP markers, list of MCP requests)
     """
+    # Most model output contains no MCP requests
+    if "```mcp" not in text:
+        return text, []
+    
     requests = []
     cleaned_text = text
     
@@ -69,15 +119,12 @@ def _validate_mcp_request(request: Dict[str, Any]) -> bool:
     Returns:
         True if valid, False otherwise
     """
-    required_fields = ["type", "server", "name"]
-    
-    for field in required_fields:
+    for field in _REQUIRED_FIELDS:
         if field not in request:
             logger.warning(f"Missing required field '{field}' in MCP request")
             return False
     
-    valid_types = ["resource", "tool"]
-    if request["type"] not in valid_types:
+    if request["type"] not in _VALID_TYPES:
         logger.warning(f"Invalid request type '{request['type']}' in MCP request")
         return False
     
@@ -90,45 +137,7 @@ def create_mcp_system_prompt() -> str:
     Returns:
         System prompt text
     """
-    return """You are an assistant with access to external tools and data sources via the Model Context Protocol (MCP).
-
-When you need to access external information or use a tool, you can use the MCP format:
-
-```mcp
-{
-    "type": "resource",
-    "server": "WebScraper",
-    "name": "webpage",
-    "params": {
-        "url": "https://example.com"
-    }
-}
-```
-
-Or for tools:
-
-```mcp
-{
-    "type": "tool",
-    "server": "SearchEngine",
-    "name": "search",
-    "params": {
-        "query": "sample search query"
-    }
-}
-```
-
-Available MCP servers:
-- WebScraper: Access web content
-  - Resources: webpage
-  - Tools: extract_text, search_text
-
-- SearchEngine: Search for information
-  - Resources: search_results
-  - Tools: search
-
-First try to answer from your knowledge. If you need external information, use the appropriate MCP request.
-"""
+    return MCP_SYSTEM_PROMPT
 
 
 def format_mcp_results_for_model(results: Dict[str, Any]) -> str:
@@ -140,12 +149,22 @@ def format_mcp_results_for_model(results: Dict[str, Any]) -> str:
     Returns:
         Formatted results string
     """
-    formatted = "Here are the results from the MCP requests:\n\n"
+    parts = ["Here are the results from the MCP requests:\n\n"]
     
     for request_id, result in results.items():
-        formatted += f"# {request_id}\n"
-        formatted += f"```json\n{json.dumps(result, indent=2)}\n```\n\n"
-    
-    formatted += "Use this information to formulate your response."
-    
-    return formatted
+        if isinstance(result, str):
+            # Plain-text output is passed through as-is, so it is not JSON
+            parts.append(f"# {request_id}\n```\n")
+            parts.append(result)
+        else:
+            parts.append(f"# {request_id}\n```json\n")
+            parts.append(
+                orjson.dumps(
+                    result, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS
+                ).decode()
+            )
+        parts.append("\n```\n\n")
+    
+    parts.append("Use this information to formulate your response.")
+    
+    return "".join(parts)
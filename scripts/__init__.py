@@ -0,0 +1,22 @@
+"""Helper scripts for running and exercising the MCP service."""
+
+import asyncio
+from typing import Any, Coroutine, TypeVar
+
+T = TypeVar("T")
+
+
+def run(main: Coroutine[Any, Any, T]) -> T:
+    """Run a coroutine to completion, on uvloop's event loop when installed.
+    
+    Args:
+        main: Coroutine to run
+    
+    Returns:
+        The coroutine's result
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return asyncio.run(main)
+    return uvloop.run(main)
@@ -0,0 +1,32 @@
+# cython: language_level=3
+"""
+Compiled scoring core for the sample SearchEngine.
+
+This module is optional. Build it in place with:
+
+    cythonize -i scripts/_search_core.pyx
+
+When it is not built, search_server.py falls back to Numba or pure Python.
+"""
+
+cimport cython
+from libc.stdint cimport int8_t, int32_t
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef void score(
+    const int32_t[::1] query_token_ids,
+    const int32_t[::1] postings_doc_ids,
+    const int8_t[::1] postings_weights,
+    const int32_t[::1] token_offsets,
+    float[::1] scores,
+) noexcept:
+    """Accumulate posting weights for the query tokens into scores."""
+    cdef Py_ssize_t i, p
+    cdef int32_t token_id
+    
+    for i in range(query_token_ids.shape[0]):
+        token_id = query_token_ids[i]
+        for p in range(token_offsets[token_id], token_offsets[token_id + 1]):
+            scores[postings_doc_ids[p]] += postings_weights[p]
@@ -7,12 +7,13 @@ It provides a command-line interface for adding, removing, and listing MCP serve
 """
 
 import argparse
-import json
 import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Optional
 
+import orjson
+
 from app.config.config import AppConfig, MCPServerConfig, TransportConfig, TransportType
 
 
@@ -29,8 +30,8 @@ def load_config(config_path: Path) -> Dict:
         print(f"Configuration file not found: {config_path}")
         return create_default_config()
     
-    with open(config_path, "r") as f:
-        return json.load(f)
+    with open(config_path, "rb") as f:
+        return orjson.loads(f.read())
 
 
 def save_config(config: Dict, config_path: Path) -> None:
@@ -42,8 +43,8 @@ def save_config(config: Dict, config_path: Path) -> None:
     """
     config_path.parent.mkdir(exist_ok=True, parents=True)
     
-    with open(config_path, "w") as f:
-        json.dump(config, f, indent=2)
+    with open(config_path, "wb") as f:
+        f.write(orjson.dumps(config, option=orjson.OPT_INDENT_2))
     
     print(f"Configuration saved to {config_path}")
 
@@ -80,6 +81,19 @@ def create_default_config() -> Dict:
     }
 
 
+def _servers_by_name(config: Dict) -> Dict[str, Dict]:
+    """Index the configured MCP servers by name.
+    
+    Args:
+        config: Configuration dictionary
+        
+    Returns:
+        Dictionary of server name to server configuration, in config order
+    """
+    servers = config.get("mcp", {}).get("mcp_servers", [])
+    return {server["name"]: server for server in servers}
+
+
 def list_servers(config: Dict) -> None:
     """List configured MCP servers.
     
@@ -132,12 +146,11 @@ def add_server(config: Dict, name: str, transport_type: str, url: Optional[str]
     if "mcp_servers" not in config["mcp"]:
         config["mcp"]["mcp_servers"] = []
     
+    servers = _servers_by_name(config)
+    
     # Check if server already exists
-    for server in config["mcp"]["mcp_servers"]:
-        if server["name"] == name:
-            print(f"Server '{name}' already exists, updating configuration")
-            config["mcp"]["mcp_servers"].remove(server)
-            break
+    if servers.pop(name, None) is not None:
+        print(f"Server '{name}' already exists, updating configuration")
     
     # Create transport configuration
     transport = {"type": transport_type}
@@ -169,7 +182,8 @@ def add_server(config: Dict, name: str, transport_type: str, url: Optional[str]
     }
     
     # Add to configuration
-    config["mcp"]["mcp_servers"].append(server)
+    servers[name] = server
+    config["mcp"]["mcp_servers"] = list(servers.values())
     
     print(f"Added MCP server '{name}' with {transport_type} transport")
     
@@ -190,14 +204,14 @@ def remove_server(config: Dict, name: str) -> Dict:
         print("No MCP servers configured")
         return config
     
-    # Find server by name
-    for server in config["mcp"]["mcp_servers"]:
-        if server["name"] == name:
-            config["mcp"]["mcp_servers"].remove(server)
-            print(f"Removed MCP server '{name}'")
-            return config
+    servers = _servers_by_name(config)
+    
+    if servers.pop(name, None) is None:
+        print(f"MCP server '{name}' not found")
+        return config
     
-    print(f"MCP server '{name}' not found")
+    config["mcp"]["mcp_servers"] = list(servers.values())
+    print(f"Removed MCP server '{name}'")
     return config
 
 
@@ -9,7 +9,6 @@ This script shows how to:
 """
 
 import argparse
-import asyncio
 import logging
 import sys
 from datetime import datetime, timedelta
@@ -17,6 +16,7 @@ from pathlib import Path
 from typing import List, Optional
 
 from app.scheduler.scheduler_service import SchedulerService
+from scripts import run
 
 # Configure logging
 logging.basicConfig(
@@ -38,7 +38,8 @@ async def schedule_demo_conversation(service: SchedulerService, minutes_from_now
     """
     scheduled_time = datetime.now() + timedelta(minutes=minutes_from_now)
     
-    logger.info(f"Scheduling a demo conversation for {scheduled_time.isoformat()}")
+    if logger.isEnabledFor(logging.INFO):
+        logger.info("Scheduling a demo conversation for %s", scheduled_time.isoformat())
     
     return await service.schedule_conversation(
         conversation_text="This is a demonstration of the Scheduler service integration with RussellDemo.",
@@ -92,19 +93,19 @@ async def main() -> int:
         if args.schedule:
             conversation_id = await schedule_demo_conversation(service, args.minutes)
             if conversation_id:
-                logger.info(f"Successfully scheduled conversation: {conversation_id}")
+                logger.info("Successfully scheduled conversation: %s", conversation_id)
                 
                 # Check the status immediately
                 status = await service.get_conversation_status(conversation_id)
-                logger.info(f"Current status: {status}")
+                logger.info("Current status: %s", status)
                 
                 # Print command to check status later
                 print(f"\nTo check status later, run:")
-                print(f"python scripts/scheduler_example.py --check {conversation_id}")
+                print(f"python -m scripts.scheduler_example --check {conversation_id}")
                 
                 # Print command to cancel the conversation
                 print(f"\nTo cancel this conversation, run:")
-                print(f"python scripts/scheduler_example.py --cancel {conversation_id}")
+                print(f"python -m scripts.scheduler_example --cancel {conversation_id}")
             else:
                 logger.error("Failed to schedule conversation")
                 return 1
@@ -113,22 +114,22 @@ async def main() -> int:
         if args.check:
             status = await service.get_conversation_status(args.check)
             if status:
-                logger.info(f"Conversation status for {args.check}: {status}")
+                logger.info("Conversation status for %s: %s", args.check, status)
             else:
-                logger.error(f"Failed to get status for conversation {args.check}")
+                logger.error("Failed to get status for conversation %s", args.check)
                 return 1
         
         # Cancel conversation
         if args.cancel:
             cancelled = await service.cancel_conversation(args.cancel)
             if cancelled:
-                logger.info(f"Successfully cancelled conversation {args.cancel}")
+                logger.info("Successfully cancelled conversation %s", args.cancel)
                 
                 # Check the status after cancellation
                 status = await service.get_conversation_status(args.cancel)
-                logger.info(f"Current status: {status}")
+                logger.info("Current status: %s", status)
             else:
-                logger.error(f"Failed to cancel conversation {args.cancel}")
+                logger.error("Failed to cancel conversation %s", args.cancel)
                 return 1
         
         return 0
@@ -139,4 +140,4 @@ async def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(asyncio.run(main()))
+    sys.exit(run(main()))
@@ -9,13 +9,36 @@ Usage:
     python search_server.py
 """
 
+import heapq
 import json
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import re
+import sys
+from array import array
+from functools import lru_cache
+from typing import Any, Callable, Dict, FrozenSet, List, Optional, Tuple
 
+import orjson
 import uvicorn
 from fastapi import FastAPI, Request
-from fastapi.responses import StreamingResponse
+from fastapi.responses import ORJSONResponse, StreamingResponse
+
+# Compiled scorers are optional; without them the pure-Python scorer is used
+try:
+    import numpy as np
+    from numba import njit
+except ImportError:
+    np = None
+    njit = None
+
+try:
+    from _search_core import score as _cython_score
+except ImportError:
+    try:
+        from scripts._search_core import score as _cython_score
+    except ImportError:
+        _cython_score = None
 
 # Setup logging
 logging.basicConfig(
@@ -24,10 +47,49 @@ logging.basicConfig(
 )
 logger = logging.getLogger("search_server")
 
+# Pattern for splitting text into search tokens
+_TOKEN_RE = re.compile(r"\w+")
+
+
+def tokenize(text: str) -> FrozenSet[str]:
+    """Split text into a set of lowercase tokens.
+    
+    Args:
+        text: Text to tokenize
+        
+    Returns:
+        Set of tokens
+    """
+    return frozenset(sys.intern(token) for token in _TOKEN_RE.findall(text.lower()))
+
+
+@lru_cache(maxsize=256)
+def tokenize_query(query: str) -> FrozenSet[str]:
+    """Tokenize a search query, reusing the result for repeated queries.
+    
+    Args:
+        query: Search query
+        
+    Returns:
+        Set of query tokens
+    """
+    return tokenize(query)
+
+
+if njit is not None:
+    @njit("void(int32[:], int32[:], int8[:], int32[:], float32[:])", cache=True, fastmath=True)
+    def _numba_score(query_token_ids, postings_doc_ids, postings_weights, token_offsets, scores):
+        """Accumulate posting weights for the query tokens into scores."""
+        for token_id in query_token_ids:
+            for p in range(token_offsets[token_id], token_offsets[token_id + 1]):
+                scores[postings_doc_ids[p]] += postings_weights[p]
+
+
 # Create FastAPI app
 app = FastAPI(
     title="Search MCP Server",
     description="MCP Server for search functionality",
+    default_response_class=ORJSONResponse,
 )
 
 
@@ -63,6 +125,130 @@ class SearchEngine:
                 "content": "REST (Representational State Transfer) is an architectural style for designing networked applications.",
             },
         ]
+        self._array_scorer: Optional[Callable[..., None]] = None
+        # Per-instance cache of results for repeated queries
+        self._search_cached = lru_cache(maxsize=1024)(self._search_uncached)
+        self._build_index()
+    
+    def _build_index(self) -> None:
+        """Tokenize the documents and build the inverted index.
+        
+        Each token maps to parallel arrays of document indices and weights,
+        where a title match weighs 2 and a content match weighs 1. Cached
+        search results are invalidated.
+        """
+        self._search_cached.cache_clear()
+        self._title_tokens = [tokenize(doc["title"]) for doc in self.documents]
+        self._content_tokens = [tokenize(doc["content"]) for doc in self.documents]
+        self._index: Dict[str, Tuple[array, array]] = {}
+        
+        for doc_idx, (title_tokens, content_tokens) in enumerate(
+            zip(self._title_tokens, self._content_tokens)
+        ):
+            for token in title_tokens | content_tokens:
+                weight = 2 * (token in title_tokens) + (token in content_tokens)
+                doc_ids, weights = self._index.setdefault(token, (array("i"), array("b")))
+                doc_ids.append(doc_idx)
+                weights.append(weight)
+        
+        if self._array_scorer is not None:
+            self._build_arrays()
+    
+    def _build_arrays(self) -> None:
+        """Flatten the inverted index into arrays for the compiled scorers.
+        
+        Postings for token ID ``t`` are stored in
+        ``[token_offsets[t], token_offsets[t + 1])``.
+        """
+        self._token_ids = {token: i for i, token in enumerate(self._index)}
+        
+        doc_ids = array("i")
+        weights = array("b")
+        offsets = array("i", [0])
+        for token_doc_ids, token_weights in self._index.values():
+            doc_ids.extend(token_doc_ids)
+            weights.extend(token_weights)
+            offsets.append(len(doc_ids))
+        
+        if np is not None:
+            # Zero-copy views, as the Numba scorer requires NumPy arrays
+            self._postings = (
+                np.frombuffer(doc_ids, dtype=np.int32),
+                np.frombuffer(weights, dtype=np.int8),
+                np.frombuffer(offsets, dtype=np.int32),
+            )
+        else:
+            self._postings = (doc_ids, weights, offsets)
+    
+    def _activate_array_scorer(self, scorer: Callable[..., None]) -> None:
+        """Score queries with a compiled scorer over the flattened index.
+        
+        Args:
+            scorer: Function taking query token IDs, the postings arrays and
+                an output score array
+        """
+        self._array_scorer = scorer
+        self._build_arrays()
+        self._search_cached.cache_clear()
+    
+    def activate_numba_scorer(self) -> bool:
+        """Score queries with the Numba-compiled scorer.
+        
+        Returns:
+            True if the Numba scorer is active, False if Numba is unavailable
+        """
+        if njit is None:
+            logger.warning("Numba is not installed, using the current scorer")
+            return False
+        
+        self._activate_array_scorer(_numba_score)
+        return True
+    
+    def activate_compiled_scorer(self) -> bool:
+        """Score queries with the fastest available compiled scorer.
+        
+        The Cython scoring core is preferred when it has been built, since it
+        needs no JIT warmup; otherwise Numba is used if installed.
+        
+        Returns:
+            True if a compiled scorer is active, False otherwise
+        """
+        if _cython_score is not None:
+            self._activate_array_scorer(_cython_score)
+            return True
+        return self.activate_numba_scorer()
+    
+    def _score(self, query: str) -> Dict[int, int]:
+        """Score documents against a query.
+        
+        Args:
+            query: Search query
+            
+        Returns:
+            Dictionary of document index to score, for matching documents only
+        """
+        if self._array_scorer is not None:
+            query_token_ids = [
+                self._token_ids[t] for t in tokenize_query(query) if t in self._token_ids
+            ]
+            if np is not None:
+                query_token_ids = np.array(query_token_ids, dtype=np.int32)
+                scores = np.zeros(len(self.documents), dtype=np.float32)
+            else:
+                query_token_ids = array("i", query_token_ids)
+                scores = array("f", [0.0]) * len(self.documents)
+            
+            self._array_scorer(query_token_ids, *self._postings, scores)
+            return {i: int(score) for i, score in enumerate(scores) if score}
+        
+        scores: Dict[int, int] = {}
+        for token in tokenize_query(query):
+            postings = self._index.get(token)
+            if postings is None:
+                continue
+            for doc_idx, weight in zip(*postings):
+                scores[doc_idx] = scores.get(doc_idx, 0) + weight
+        return scores
     
     def search(self, query: str, max_results: int = 3) -> List[Dict[str, Any]]:
         """Search for documents containing the query.
@@ -77,32 +263,43 @@ class SearchEngine:
         if not query:
             return []
         
-        # Very simple search implementation
-        query = query.lower()
-        results = []
+        # Cached results are shared, so hand each caller fresh dicts
+        return [
+            {"id": doc_id, "title": title, "snippet": snippet, "score": score}
+            for doc_id, title, snippet, score in self._search_cached(query.lower(), max_results)
+        ]
+    
+    def _search_uncached(
+        self, query: str, max_results: int
+    ) -> Tuple[Tuple[Any, str, str, float], ...]:
+        """Search for documents containing the query, bypassing the cache.
         
-        for doc in self.documents:
-            score = 0
-            if query in doc["title"].lower():
-                score += 2
-            if query in doc["content"].lower():
-                score += 1
+        Args:
+            query: Lowercase search query
+            max_results: Maximum number of results to return
             
-            if score > 0:
-                results.append({
-                    "id": doc["id"],
-                    "title": doc["title"],
-                    "snippet": doc["content"][:100] + "...",
-                    "score": score,
-                })
+        Returns:
+            Immutable (id, title, snippet, score) tuples for the matching documents
+        """
+        scores = self._score(query)
+        
+        # Keep the top results, ties in document order
+        top = heapq.nlargest(
+            max_results, scores.items(), key=lambda item: (item[1], -item[0])
+        )
+        
+        results = []
+        for doc_idx, score in top:
+            doc = self.documents[doc_idx]
+            results.append((doc["id"], doc["title"], doc["content"][:100] + "...", score))
         
-        # Sort by score and limit results
-        results.sort(key=lambda x: x["score"], reverse=True)
-        return results[:max_results]
+        return tuple(results)
 
 
-# Initialize search engine
+# Initialize search engine, using the Cython scoring core if it has been built
 search_engine = SearchEngine()
+if _cython_score is not None:
+    search_engine.activate_compiled_scorer()
 
 
 @app.post("/search-mcp")
@@ -113,31 +310,72 @@ async def search_mcp(request: Request):
     """
     try:
         # Parse the request
-        data = await request.json()
+        data = orjson.loads(await request.body())
         
         request_type = data.get("type")
         name = data.get("name")
         params = data.get("params", {})
         
-        logger.info(f"Received {request_type} request for {name}")
+        logger.info("Received %s request for %s", request_type, name)
         
         # Handle the request
-        if request_type == "resource":
-            response = handle_resource(name, params)
-        elif request_type == "tool":
-            response = handle_tool(name, params)
+        handler = _REQUEST_HANDLERS.get(request_type)
+        if handler is not None:
+            response = handler(name, params)
         else:
-            logger.warning(f"Unsupported request type: {request_type}")
+            logger.warning("Unsupported request type: %s", request_type)
             response = {"error": f"Unsupported request type: {request_type}"}
         
         # Return the response
         return response
     
     except Exception as e:
-        logger.exception(f"Error handling request: {e}")
+        logger.exception("Error handling request: %s", e)
         return {"error": f"Server error: {str(e)}"}
 
 
+def _search_resource(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the search_results resource."""
+    query = params.get("query", "")
+    max_results = params.get("max_results", 3)
+    
+    results = search_engine.search(query, max_results)
+    return {"results": results}
+
+
+def _list_resources(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Get the available_resources resource."""
+    return {"resources": ["search_results"]}
+
+
+def _search_tool(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the search tool."""
+    query = params.get("query", "")
+    max_results = params.get("max_results", 3)
+    
+    results = search_engine.search(query, max_results)
+    return {
+        "query": query,
+        "results": results,
+    }
+
+
+def _list_tools(params: Dict[str, Any]) -> Dict[str, Any]:
+    """Run the available_tools tool."""
+    return {"tools": ["search"]}
+
+
+# Handlers by resource and tool name
+_RESOURCE_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "search_results": _search_resource,
+    "available_resources": _list_resources,
+}
+_TOOL_HANDLERS: Dict[str, Callable[[Dict[str, Any]], Dict[str, Any]]] = {
+    "search": _search_tool,
+    "available_tools": _list_tools,
+}
+
+
 def handle_resource(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
     """Handle a resource request.
     
@@ -148,19 +386,11 @@ def handle_resource(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Resource data
     """
-    if name == "search_results":
-        query = params.get("query", "")
-        max_results = params.get("max_results", 3)
-        
-        results = search_engine.search(query, max_results)
-        return {"results": results}
-    
-    elif name == "available_resources":
-        return {"resources": ["search_results"]}
-    
-    else:
-        logger.warning(f"Unknown resource: {name}")
+    handler = _RESOURCE_HANDLERS.get(name)
+    if handler is None:
+        logger.warning("Unknown resource: %s", name)
         return {"error": f"Unknown resource: {name}"}
+    return handler(params)
 
 
 def handle_tool(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
@@ -173,28 +403,29 @@ def handle_tool(name: str, params: Dict[str, Any]) -> Dict[str, Any]:
     Returns:
         Tool result
     """
-    if name == "search":
-        query = params.get("query", "")
-        max_results = params.get("max_results", 3)
-        
-        results = search_engine.search(query, max_results)
-        return {
-            "query": query,
-            "results": results,
-        }
-    
-    elif name == "available_tools":
-        return {"tools": ["search"]}
-    
-    else:
-        logger.warning(f"Unknown tool: {name}")
+    handler = _TOOL_HANDLERS.get(name)
+    if handler is None:
+        logger.warning("Unknown tool: %s", name)
         return {"error": f"Unknown tool: {name}"}
+    return handler(params)
+
+
+# Handlers by request type
+_REQUEST_HANDLERS: Dict[str, Callable[[str, Dict[str, Any]], Dict[str, Any]]] = {
+    "resource": handle_resource,
+    "tool": handle_tool,
+}
 
 
 if __name__ == "__main__":
+    # Auto-reload is for development only and cannot be combined with workers
+    reload = os.environ.get("DEV") == "1"
     uvicorn.run(
         "search_server:app",
         host="0.0.0.0",
         port=8002,  # Using port 8002 for search server to avoid conflicts with main MCP service
-        reload=True,
+        loop="uvloop",
+        http="httptools",
+        workers=None if reload else int(os.environ.get("WORKERS", os.cpu_count() or 1)),
+        reload=reload,
     )
@@ -7,18 +7,70 @@ This script:
 2. Ensures config.json uses environment variables for API keys
 """
 
-import json
 import os
 import sys
+from functools import lru_cache
 from pathlib import Path
 from shutil import copyfile
 
+import orjson
+
 # Paths
 ENV_EXAMPLE_PATH = Path(".env.example")
 ENV_PATH = Path(".env")
 CONFIG_TEMPLATE_PATH = Path("config/config.template.json")
 CONFIG_PATH = Path("config/config.json")
 
+# API keys that should reference environment variables:
+# (path in config, environment variable reference, template placeholder)
+KEY_SPEC = (
+    (("models", "anthropic", "api_key"), "${ANTHROPIC_API_KEY}", "your_anthropic_api_key_here"),
+    (("models", "openai", "api_key"), "${OPENAI_API_KEY}", "your_openai_api_key_here"),
+    (("model", "api_key"), "${ANTHROPIC_API_KEY}", "your_anthropic_api_key_here"),
+)
+
+
+def _walk(config: dict, path: tuple) -> str:
+    """Get a nested config value.
+    
+    Args:
+        config: Configuration dictionary
+        path: Keys leading to the value
+        
+    Returns:
+        The value, or an empty string if any key is missing
+    """
+    for key in path[:-1]:
+        config = config.get(key, {})
+    return config.get(path[-1], "")
+
+
+def _set(config: dict, path: tuple, value: str) -> None:
+    """Set a nested config value whose parent keys exist.
+    
+    Args:
+        config: Configuration dictionary
+        path: Keys leading to the value
+        value: Value to set
+    """
+    for key in path[:-1]:
+        config = config[key]
+    config[path[-1]] = value
+
+
+@lru_cache(maxsize=4)
+def _load_config(path: str, mtime: float) -> dict:
+    """Load a JSON config file, cached until its modification time changes.
+    
+    Args:
+        path: Path to the config file
+        mtime: Modification time of the config file, used as part of the cache key
+        
+    Returns:
+        Configuration dictionary
+    """
+    return orjson.loads(Path(path).read_bytes())
+
 
 def ensure_env_file():
     """Ensure that a .env file exists."""
@@ -47,47 +99,33 @@ def ensure_config_uses_env_vars():
     elif CONFIG_PATH.exists():
         # Check if config.json already uses environment variables
         try:
-            with open(CONFIG_PATH, "r") as f:
-                config = json.load(f)
-            
-            # Check if API keys are using environment variables
-            anthropic_key = config.get("models", {}).get("anthropic", {}).get("api_key", "")
-            openai_key = config.get("models", {}).get("openai", {}).get("api_key", "")
-            main_key = config.get("model", {}).get("api_key", "")
-            
-            needs_update = False
+            config = _load_config(str(CONFIG_PATH), CONFIG_PATH.stat().st_mtime)
             
-            # Check if any API key looks like an actual key (not an env var placeholder)
-            if anthropic_key and not anthropic_key.startswith("${") and anthropic_key != "your_anthropic_api_key_here":
-                needs_update = True
+            # Find API keys that look like actual keys (not env var placeholders)
+            updates = []
+            for path, env_ref, placeholder in KEY_SPEC:
+                key = _walk(config, path)
+                if key and not key.startswith("${") and key != placeholder:
+                    updates.append((path, env_ref))
             
-            if openai_key and not openai_key.startswith("${") and openai_key != "your_openai_api_key_here":
-                needs_update = True
-            
-            if main_key and not main_key.startswith("${") and main_key != "your_anthropic_api_key_here":
-                needs_update = True
-            
-            if needs_update:
+            if updates:
                 print(f"Updating {CONFIG_PATH} to use environment variables for API keys")
                 
-                # Update API keys to use environment variables
-                if anthropic_key and not anthropic_key.startswith("${"):
-                    config["models"]["anthropic"]["api_key"] = "${ANTHROPIC_API_KEY}"
-                
-                if openai_key and not openai_key.startswith("${"):
-                    config["models"]["openai"]["api_key"] = "${OPENAI_API_KEY}"
-                
-                if main_key and not main_key.startswith("${"):
-                    config["model"]["api_key"] = "${ANTHROPIC_API_KEY}"
+                # Update API keys to use environment variables; the cached copy
+                # is now modified, so drop it
+                for path, env_ref in updates:
+                    _set(config, path, env_ref)
+                _load_config.cache_clear()
                 
                 # Create a backup of the original config
                 backup_path = CONFIG_PATH.with_suffix(".backup.json")
                 print(f"Creating backup of original config at {backup_path}")
                 copyfile(CONFIG_PATH, backup_path)
                 
-                # Write the updated config
-                with open(CONFIG_PATH, "w") as f:
-                    json.dump(config, f, indent=2)
+                # Write the updated config atomically
+                tmp_path = CONFIG_PATH.with_suffix(".tmp")
+                tmp_path.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
+                os.replace(tmp_path, CONFIG_PATH)
                 
                 print(f"Updated {CONFIG_PATH} to use environment variables")
                 return True
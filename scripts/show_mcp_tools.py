@@ -7,7 +7,7 @@ This script queries the MCP Host service to get information about:
 2. Tool capabilities of MCP servers
 
 Usage:
-    python show_mcp_tools.py [--port PORT]
+    python -m scripts.show_mcp_tools [--port PORT]
 
 Options:
     --port PORT    Port to use for the MCP Host service (default: 8001)
@@ -15,79 +15,113 @@ Options:
 
 import argparse
 import asyncio
-import json
 import os
 import sys
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
 import httpx
+import orjson
 
+from scripts import run
 
-async def get_auth_token(base_url: str) -> Optional[str]:
+# Default configuration file, relative to the repository root
+CONFIG_PATH = Path(__file__).resolve().parents[1] / "config" / "config.json"
+
+
+async def get_auth_token(client: httpx.AsyncClient) -> Optional[str]:
     """Get authentication token from the API.
     
     Args:
-        base_url: Base URL of the API
+        client: HTTP client for the API
         
     Returns:
         Bearer token string if successful, None otherwise
     """
     print("Authenticating...")
     try:
-        async with httpx.AsyncClient() as client:
-            response = await client.post(
-                f"{base_url}/auth/token",
-                data={"username": "admin", "password": "adminpassword"},
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
-            )
-            
-            if response.status_code != 200:
-                print(f"Authentication failed: {response.text}")
-                return None
-                
-            token_data = response.json()
-            token = token_data.get("access_token")
-            token_type = token_data.get("token_type", "bearer")
+        response = await client.post(
+            "/auth/token",
+            data={"username": "admin", "password": "adminpassword"},
+            headers={"Content-Type": "application/x-www-form-urlencoded"}
+        )
+        
+        if response.status_code != 200:
+            print(f"Authentication failed: {response.text}")
+            return None
             
-            return f"{token_type} {token}"
+        token_data = orjson.loads(response.content)
+        token = token_data.get("access_token")
+        token_type = token_data.get("token_type", "bearer")
+        
+        return f"{token_type} {token}"
     except Exception as e:
         print(f"Authentication error: {e}")
         return None
 
 
-async def get_model_providers(base_url: str, auth_header: Dict[str, str]) -> Dict:
+async def get_model_providers(client: httpx.AsyncClient) -> Dict:
     """Get all model providers including MCP servers.
     
     Args:
-        base_url: Base URL of the API
-        auth_header: Authentication header
+        client: Authenticated HTTP client for the API
         
     Returns:
         Dict with model providers data
     """
     print("\nGetting model providers...")
-    async with httpx.AsyncClient() as client:
-        response = await client.get(f"{base_url}/models", headers=auth_header)
+    response = await client.get("/models")
+    
+    if response.status_code != 200:
+        print(f"Failed to get model providers: {response.text}")
+        return {}
         
-        if response.status_code != 200:
-            print(f"Failed to get model providers: {response.text}")
-            return {}
-            
-        providers_data = response.json()
-        return providers_data
-
+    providers_data = orjson.loads(response.content)
+    return providers_data
 
 
+async def _introspect(
+    client: httpx.AsyncClient,
+    endpoint: str,
+    request_type: str,
+    name: str,
+) -> Optional[Dict]:
+    """Send an introspection request to an MCP server endpoint.
+    
+    Args:
+        client: Authenticated HTTP client for the API
+        endpoint: MCP server endpoint
+        request_type: Type of request (resource/tool)
+        name: Name of the resource or tool
+        
+    Returns:
+        Response data if the request succeeded, None otherwise
+    """
+    try:
+        response = await client.post(
+            endpoint,
+            json={
+                "type": request_type,
+                "name": name,
+                "params": {}
+            },
+            timeout=10.0
+        )
+        
+        if response.status_code == 200:
+            return orjson.loads(response.content)
+    except Exception:
+        pass  # Silently continue if this fails
+    
+    return None
 
 
-async def test_mcp_server_tools(base_url: str, server_name: str, auth_header: Dict[str, str]) -> Dict:
+async def test_mcp_server_tools(client: httpx.AsyncClient, server_name: str) -> Dict:
     """Test for available tools on an MCP server.
     
     Args:
-        base_url: Base URL of the API
+        client: Authenticated HTTP client for the API
         server_name: Name of the MCP server
-        auth_header: Authentication header
         
     Returns:
         Dict with MCP tools data
@@ -96,46 +130,29 @@ async def test_mcp_server_tools(base_url: str, server_name: str, auth_header: Di
     # that might be implemented by the MCP servers
     print(f"\nTesting tools for {server_name} MCP server...")
     try:
-        # Try a generic approach
-        # First approach: Try direct introspection via dedicated endpoint if it exists
-        endpoint = f"{base_url}/{server_name.lower()}"
+        # Try direct introspection via dedicated endpoint if it exists,
+        # asking for available tools and resources at the same time and
+        # using whichever succeeds first
+        endpoint = f"/{server_name.lower()}"
         
-        async with httpx.AsyncClient() as client:
-            try:
-                # Try for available tools
-                response = await client.post(
-                    endpoint,
-                    json={
-                        "type": "tool",
-                        "name": "available_tools",
-                        "params": {}
-                    },
-                    headers=auth_header,
-                    timeout=10.0
-                )
-                
-                if response.status_code == 200:
-                    return response.json()
-            except Exception:
-                pass  # Silently continue if this fails
-                
-            try:
-                # Try for available resources
-                response = await client.post(
-                    endpoint,
-                    json={
-                        "type": "resource",
-                        "name": "available_resources",
-                        "params": {}
-                    },
-                    headers=auth_header,
-                    timeout=10.0
+        pending = {
+            asyncio.create_task(_introspect(client, endpoint, "tool", "available_tools")),
+            asyncio.create_task(
+                _introspect(client, endpoint, "resource", "available_resources")
+            ),
+        }
+        try:
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
                 )
-                
-                if response.status_code == 200:
-                    return response.json()
-            except Exception:
-                pass  # Silently continue if this fails
+                for task in done:
+                    result = task.result()
+                    if result is not None:
+                        return result
+        finally:
+            for task in pending:
+                task.cancel()
         
         return {"error": f"Could not introspect tools for {server_name}"}
                 
@@ -150,22 +167,25 @@ async def pretty_print_json(data: Dict) -> None:
     Args:
         data: Dictionary to print
     """
-    print(json.dumps(data, indent=2))
+    print(orjson.dumps(data, option=orjson.OPT_INDENT_2).decode())
 
 
-def load_mcp_config() -> Dict[str, Any]:
+def load_mcp_config(config_path: Path = CONFIG_PATH) -> Dict[str, Any]:
     """Load MCP configuration from config file.
     
+    This does blocking file I/O; call it with asyncio.to_thread from async code.
+    
+    Args:
+        config_path: Path to the configuration file
+        
     Returns:
         Dict containing MCP server configurations
     """
     try:
-        config_path = Path('/Users/jonbrandon/code/AI/RussellDemo/host/config/config.json')
         if not config_path.exists():
             return {}
             
-        with open(config_path, 'r') as f:
-            config = json.load(f)
+        config = orjson.loads(config_path.read_bytes())
             
         return config.get('mcp', {})
     except Exception as e:
@@ -173,19 +193,12 @@ def load_mcp_config() -> Dict[str, Any]:
         return {}
 
 
-async def main():
-    """Main entry point."""
-    # Parse command line arguments
-    parser = argparse.ArgumentParser(description="Show available MCP tools")
-    parser.add_argument("--port", type=int, default=8000, help="Port for the API (default: 8000)")
-    args = parser.parse_args()
-    
-    # Set up base URL
-    base_url = f"http://localhost:{args.port}/api"
+def print_mcp_config(mcp_config: Dict[str, Any]) -> None:
+    """Print the MCP server configuration.
     
-    # Load MCP configuration
-    print("\n=== MCP Configuration ===")
-    mcp_config = load_mcp_config()
+    Args:
+        mcp_config: MCP configuration dictionary
+    """
     if mcp_config:
         mcp_servers_config = mcp_config.get('mcp_servers', [])
         print(f"Found {len(mcp_servers_config)} MCP servers in configuration")
@@ -202,46 +215,76 @@ async def main():
                 print(f"   URL: {url}")
                 
             if 'config' in server:
-                print(f"   Configuration: {json.dumps(server['config'], indent=2)}")
+                print(f"   Configuration: {orjson.dumps(server['config'], option=orjson.OPT_INDENT_2).decode()}")
     else:
         print("No MCP configuration found")
+
+
+async def main():
+    """Main entry point."""
+    # Parse command line arguments
+    parser = argparse.ArgumentParser(description="Show available MCP tools")
+    parser.add_argument("--port", type=int, default=8000, help="Port for the API (default: 8000)")
+    args = parser.parse_args()
     
-    # Get auth token
-    auth_token = await get_auth_token(base_url)
-    if not auth_token:
-        print("Could not authenticate. Make sure the MCP Host service is running.")
-        sys.exit(1)
-        
-    auth_header = {"Authorization": auth_token}
+    # Set up base URL
+    base_url = f"http://localhost:{args.port}/api"
     
-    # Get all providers
-    providers_data = await get_model_providers(base_url, auth_header)
-    if not providers_data:
-        print("Could not get providers data. Make sure the MCP Host service is running.")
-        sys.exit(1)
+    # Share one connection pool across all API calls
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        http2=True,
+        limits=httpx.Limits(max_keepalive_connections=20),
+    ) as client:
+        # Authenticate while the MCP configuration is loaded
+        auth_token, mcp_config = await asyncio.gather(
+            get_auth_token(client),
+            asyncio.to_thread(load_mcp_config),
+        )
         
-    print("\n=== All Providers (Including MCP Servers) ===")
-    await pretty_print_json(providers_data)
-    
-    # Extract MCP servers
-    mcp_servers = [p for p in providers_data.get("providers", []) 
-                  if p.get("is_mcp_server", False)]
-    
-    if not mcp_servers:
-        print("\nNo MCP servers found.")
-        sys.exit(0)
+        print("\n=== MCP Configuration ===")
+        print_mcp_config(mcp_config)
         
-    print(f"\nFound {len(mcp_servers)} MCP servers:")
-    for server in mcp_servers:
-        print(f"  - {server['name']}")
-    
-    # Test each MCP server
-    for server in mcp_servers:
-        server_name = server["name"]
-        server_tools = await test_mcp_server_tools(base_url, server_name, auth_header)
+        if not auth_token:
+            print("Could not authenticate. Make sure the MCP Host service is running.")
+            sys.exit(1)
+            
+        # Send the token with every subsequent request
+        client.headers["Authorization"] = auth_token
         
-        print(f"\n=== {server_name} MCP Server Tools ===")
-        await pretty_print_json(server_tools)
+        # Get all providers
+        providers_data = await get_model_providers(client)
+        if not providers_data:
+            print("Could not get providers data. Make sure the MCP Host service is running.")
+            sys.exit(1)
+            
+        print("\n=== All Providers (Including MCP Servers) ===")
+        await pretty_print_json(providers_data)
+        
+        # Extract MCP servers
+        mcp_servers = [p for p in providers_data.get("providers", []) 
+                      if p.get("is_mcp_server", False)]
+        
+        if not mcp_servers:
+            print("\nNo MCP servers found.")
+            sys.exit(0)
+            
+        print(f"\nFound {len(mcp_servers)} MCP servers:")
+        for server in mcp_servers:
+            print(f"  - {server['name']}")
+        
+        # Test all MCP servers concurrently
+        results = await asyncio.gather(
+            *(test_mcp_server_tools(client, server["name"]) for server in mcp_servers),
+            return_exceptions=True,
+        )
+        
+        for server, server_tools in zip(mcp_servers, results):
+            if isinstance(server_tools, BaseException):
+                server_tools = {"error": str(server_tools)}
+            
+            print(f"\n=== {server['name']} MCP Server Tools ===")
+            await pretty_print_json(server_tools)
         
     # Show documentation info
     print("\n=== Documentation ===")
@@ -252,7 +295,7 @@ async def main():
 
 if __name__ == "__main__":
     try:
-        asyncio.run(main())
+        run(main())
     except Exception as e:
         print(f"Error: {e}")
         sys.exit(1)
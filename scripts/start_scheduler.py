@@ -10,10 +10,13 @@ import argparse
 import logging
 import os
 import signal
+import socket
 import subprocess
 import sys
+import threading
 import time
 from pathlib import Path
+from typing import Optional
 
 # Configure logging
 logging.basicConfig(
@@ -27,13 +30,66 @@ logger = logging.getLogger(__name__)
 DEFAULT_SCHEDULER_PATH = "/Users/jonbrandon/code/AI/RussellDemo/scheduler/McpScheduler.dll"
 
 
-def start_scheduler(scheduler_path: str, port: int = 5146, debug: bool = False) -> subprocess.Popen:
+def wait_port(port: int, process: subprocess.Popen, timeout: float = 10.0) -> bool:
+    """Wait until the service accepts TCP connections on its port.
+    
+    Polls with exponential backoff so a fast start is detected quickly.
+    
+    Args:
+        port: Port the service listens on
+        process: Process handle of the service
+        timeout: Seconds to wait before giving up
+        
+    Returns:
+        True if the port accepted a connection, False if the process exited
+        or the timeout expired
+    """
+    deadline = time.monotonic() + timeout
+    delay = 0.02
+    
+    while time.monotonic() < deadline and process.poll() is None:
+        with socket.socket() as sock:
+            sock.settimeout(0.1)
+            try:
+                sock.connect(("127.0.0.1", port))
+                return True
+            except OSError:
+                pass
+        
+        time.sleep(delay)
+        delay = min(delay * 1.5, 0.25)
+    
+    return False
+
+
+def parse_cores(value: str) -> set:
+    """Parse a comma-separated list of CPU numbers for --pin-cores.
+    
+    Args:
+        value: CPU list such as "2,3"
+        
+    Returns:
+        Set of CPU numbers
+    """
+    try:
+        return {int(core) for core in value.split(",")}
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid CPU list: {value}") from None
+
+
+def start_scheduler(
+    scheduler_path: str,
+    port: int = 5146,
+    debug: bool = False,
+    cores: Optional[set] = None,
+) -> subprocess.Popen:
     """Start the Scheduler MCP service.
     
     Args:
         scheduler_path: Path to the Scheduler service executable
         port: Port to run the service on
         debug: Enable debug output
+        cores: CPUs to pin the service to, or None to leave it unpinned
         
     Returns:
         Process handle to the started service
@@ -58,28 +114,43 @@ def start_scheduler(scheduler_path: str, port: int = 5146, debug: bool = False)
         command.append("--debug")
         logger.info("Debug mode enabled")
     
+    # Pin this idle wrapper to the requested CPUs; the .NET service and all
+    # of its threads inherit the affinity
+    if cores:
+        if hasattr(os, "sched_setaffinity"):
+            try:
+                os.sched_setaffinity(0, cores)
+            except OSError as e:
+                logger.error(f"Cannot pin Scheduler service to CPUs {sorted(cores)}: {e}")
+                logger.error(f"Available CPUs: {sorted(os.sched_getaffinity(0))}")
+                sys.exit(1)
+            logger.info(f"Pinned Scheduler service to CPUs {sorted(cores)}")
+        else:
+            logger.warning("CPU pinning is not supported on this platform, ignoring --pin-cores")
+    
     # Start the process
     try:
-        # Start the process and redirect output to a log file
+        # Start the process and redirect output to a log file. The child
+        # writes straight to the inherited descriptor, so our copy can be
+        # closed as soon as it has been spawned.
         log_path = Path("scheduler_service.log")
-        log_file = open(log_path, "w")
-        
-        process = subprocess.Popen(
-            command,
-            stdout=log_file,
-            stderr=subprocess.STDOUT,
-            text=True,
-        )
+        with open(log_path, "ab") as log_file:
+            process = subprocess.Popen(
+                command,
+                stdout=log_file,
+                stderr=subprocess.STDOUT,
+            )
         
         logger.info(f"Scheduler service started with PID {process.pid}")
         logger.info(f"Output is being logged to {log_path}")
         
-        # Give the service a moment to start up
-        time.sleep(2)
-        
-        # Check if the process is still running
-        if process.poll() is not None:
-            logger.error(f"Scheduler service failed to start: exit code {process.poll()}")
+        # Wait for the service to accept connections
+        if not wait_port(port, process):
+            if process.poll() is not None:
+                logger.error(f"Scheduler service failed to start: exit code {process.poll()}")
+            else:
+                logger.error(f"Scheduler service is not accepting connections on port {port}")
+                process.terminate()
             logger.error(f"Check the log file for details: {log_path}")
             sys.exit(1)
         
@@ -138,19 +209,25 @@ def main() -> None:
         action="store_true",
         help="Enable debug output"
     )
+    parser.add_argument(
+        "--pin-cores", 
+        type=parse_cores,
+        help="Comma-separated CPUs to pin the service to, e.g. 2,3 (Linux only)"
+    )
     args = parser.parse_args()
     
     # Start the scheduler service
-    process = start_scheduler(args.path, args.port, args.debug)
+    # Stop the service on SIGINT or SIGTERM
+    stop = threading.Event()
+    for sig in (signal.SIGINT, signal.SIGTERM):
+        signal.signal(sig, lambda signum, frame: stop.set())
+    
+    process = start_scheduler(args.path, args.port, args.debug, args.pin_cores)
     
     try:
-        # Keep the script running until interrupted
+        # Sleep until a signal arrives
         logger.info("Press Ctrl+C to stop the Scheduler service")
-        while True:
-            time.sleep(1)
-    
-    except KeyboardInterrupt:
-        # Stop the service on keyboard interrupt
+        stop.wait()
         stop_scheduler(process)
     
     except Exception as e:
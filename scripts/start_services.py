@@ -11,6 +11,7 @@ This script starts:
 
 import argparse
 import asyncio
+import hashlib
 import os
 import signal
 import subprocess
@@ -18,68 +19,303 @@ import sys
 import time
 from pathlib import Path
 
+LOG_DIR = Path("logs")
 
-async def start_scheduler(port=5146, scheduler_path=None):
+# Signals that stop the launcher and all of its services
+SHUTDOWN_SIGNALS = (signal.SIGINT, signal.SIGTERM)
+
+SCRIPTS_DIR = Path(__file__).resolve().parent
+
+
+def find_script(name: str):
+    """Return the path of a helper script next to this launcher, or None."""
+    path = SCRIPTS_DIR / name
+    return str(path) if path.is_file() else None
+
+
+# Resolve the Scheduler helper scripts once at import
+SCHEDULER_SCRIPT = find_script("start_scheduler.py")
+UPDATE_SCHEDULER_SCRIPT = find_script("update_scheduler_config.py")
+
+# Inputs of update_scheduler_config.py and the digest of the last applied run
+SCHEDULER_CONFIG_FILE = Path("config/config.json")
+SCHEDULER_CONFIG_ENV = ("SCHEDULER_CLIENT_ID", "SCHEDULER_API_KEY")
+SCHEDULER_CONFIG_STAMP = Path(".scheduler_config.stamp")
+
+
+def scheduler_config_fingerprint() -> str:
+    """Fingerprint everything update_scheduler_config.py reads.
+    
+    Returns:
+        Hex digest of the update script, the config file and the Scheduler
+        credentials in the environment
+    """
+    digest = hashlib.blake2b(digest_size=16)
+    
+    for path in (Path(UPDATE_SCHEDULER_SCRIPT), SCHEDULER_CONFIG_FILE):
+        try:
+            digest.update(path.read_bytes())
+        except OSError:
+            pass
+        digest.update(b"\0")
+    
+    for name in SCHEDULER_CONFIG_ENV:
+        digest.update(os.environ.get(name, "").encode())
+        digest.update(b"\0")
+    
+    return digest.hexdigest()
+
+
+def uvicorn_command(app: str, port: int, verbose: bool = False) -> list:
+    """Build the command line for a uvicorn-served application.
+    
+    Args:
+        app: Import string of the ASGI application
+        port: Port to serve on
+        verbose: Keep uvicorn's INFO logging and per-request access log
+    
+    Returns:
+        Command line arguments for subprocess
+    """
+    command = [
+        "uvicorn", app, "--host", "0.0.0.0", "--port", str(port),
+        "--loop", "uvloop", "--http", "httptools",
+    ]
+    
+    if not verbose:
+        command.extend(["--log-level", "warning", "--no-access-log"])
+    
+    return command
+
+
+def spawn(name: str, command: list) -> subprocess.Popen:
+    """Start a child service with its output going to its log file.
+    
+    The child runs in its own session so its whole process group can be
+    signalled. No preexec_fn is passed, which keeps subprocess on its
+    vfork/posix_spawn path instead of fully forking this process first.
+    
+    Args:
+        name: Service name used for the log file name
+        command: Command line of the service
+    
+    Returns:
+        Process handle of the started service
+    """
+    LOG_DIR.mkdir(exist_ok=True)
+    
+    # The child writes straight to the inherited descriptor, so our copy
+    # can be closed once it has been spawned
+    with open(LOG_DIR / f"{name}.log", "ab") as log_file:
+        return subprocess.Popen(
+            command,
+            stdout=log_file,
+            stderr=subprocess.STDOUT,
+            start_new_session=True,
+        )
+
+
+def tail_log(name: str, size: int = 4096) -> str:
+    """Read the end of a service's log file.
+    
+    Args:
+        name: Service name used for the log file name
+        size: Maximum number of bytes to read
+    
+    Returns:
+        The last size bytes of the log, decoded
+    """
+    try:
+        with open(LOG_DIR / f"{name}.log", "rb") as f:
+            f.seek(0, os.SEEK_END)
+            f.seek(max(0, f.tell() - size))
+            return f.read().decode(errors="replace")
+    except OSError:
+        return ""
+
+
+def watch_exits(loop: asyncio.AbstractEventLoop, processes: list, callback) -> list:
+    """Call a function whenever one of the child processes exits.
+    
+    On Linux 5.3+ each child gets a pidfd registered with the event loop,
+    which becomes readable once when that child exits. Elsewhere a SIGCHLD
+    handler is used instead.
+    
+    Args:
+        loop: Running event loop
+        processes: List of (name, process) tuples
+        callback: Function called with no arguments when a child exits
+    
+    Returns:
+        List of pidfds registered with the loop
+    """
+    pidfds = []
+    
+    try:
+        for _, process in processes:
+            pidfd = os.pidfd_open(process.pid)
+            loop.add_reader(pidfd, callback)
+            pidfds.append(pidfd)
+    except (AttributeError, OSError):
+        unwatch_exits(loop, pidfds)
+        pidfds = []
+        loop.add_signal_handler(signal.SIGCHLD, callback)
+    
+    return pidfds
+
+
+def unwatch_exits(loop: asyncio.AbstractEventLoop, pidfds: list) -> None:
+    """Stop watching child processes registered by watch_exits.
+    
+    Args:
+        loop: Running event loop
+        pidfds: List of pidfds returned by watch_exits
+    """
+    for pidfd in pidfds:
+        loop.remove_reader(pidfd)
+        os.close(pidfd)
+    
+    loop.remove_signal_handler(signal.SIGCHLD)
+
+
+def signal_group(process: subprocess.Popen, sig: int) -> None:
+    """Send a signal to the process group led by a child process.
+    
+    Args:
+        process: Child started with start_new_session=True
+        sig: Signal to send
+    """
+    try:
+        os.killpg(process.pid, sig)
+    except ProcessLookupError:
+        pass
+
+
+def stop_processes(processes: list, timeout: float = 5.0) -> None:
+    """Stop all running child processes.
+    
+    Every process group is sent SIGTERM up front, then all children share a
+    single shutdown deadline before the remaining groups are killed.
+    
+    Args:
+        processes: List of (name, process) tuples
+        timeout: Seconds to wait for all children to exit
+    """
+    running = [(name, process) for name, process in processes if process.poll() is None]
+    
+    for name, process in running:
+        print(f"Terminating {name}...")
+        signal_group(process, signal.SIGTERM)
+    
+    deadline = time.monotonic() + timeout
+    for name, process in running:
+        try:
+            process.wait(timeout=max(0.0, deadline - time.monotonic()))
+        except subprocess.TimeoutExpired:
+            print(f"Force killing {name}...")
+            signal_group(process, signal.SIGKILL)
+            process.wait()
+
+
+async def wait_ready(port: int, process: subprocess.Popen, timeout: float = 10.0) -> bool:
+    """Wait until a service accepts TCP connections on its port.
+    
+    Args:
+        port: Port the service listens on
+        process: Process running the service
+        timeout: Seconds to wait before giving up
+    
+    Returns:
+        True if the port accepted a connection, False if the process exited
+        or the timeout expired
+    """
+    deadline = time.monotonic() + timeout
+    
+    while time.monotonic() < deadline and process.poll() is None:
+        try:
+            _, writer = await asyncio.open_connection("localhost", port)
+        except OSError:
+            await asyncio.sleep(0.05)
+        else:
+            writer.close()
+            await writer.wait_closed()
+            return True
+    
+    return False
+
+
+async def wait_started(name: str, process: subprocess.Popen, port: int) -> None:
+    """Report when an HTTP service is ready to accept requests.
+    
+    Args:
+        name: Service name
+        process: Process running the service
+        port: Port the service listens on
+    """
+    if await wait_ready(port, process):
+        print(f"{name} started on http://localhost:{port}")
+    else:
+        print(f"Warning: {name} is not accepting connections on port {port}. Check {LOG_DIR / f'{name}.log'} for details.")
+
+
+async def start_scheduler(port=5146, scheduler_path=None, scheduler_cores=None):
     """Start the Scheduler MCP server.
     
     Args:
         port: Port for the Scheduler service
         scheduler_path: Path to the Scheduler service executable
+        scheduler_cores: Comma-separated CPUs to pin the Scheduler to
     
     Returns:
         Tuple of (name, process) or None if failed
     """
-    # Find the Scheduler script
-    if Path("scripts/start_scheduler.py").exists():
-        scheduler_script = "scripts/start_scheduler.py"
-    else:
-        # Try to find it in the current directory
-        if Path("start_scheduler.py").exists():
-            scheduler_script = "start_scheduler.py"
-        else:
-            print("Error: start_scheduler.py not found")
-            return None
+    if SCHEDULER_SCRIPT is None:
+        print("Error: start_scheduler.py not found")
+        return None
     
-    command = [sys.executable, scheduler_script, "--port", str(port)]
+    command = [sys.executable, SCHEDULER_SCRIPT, "--port", str(port)]
     
     if scheduler_path:
         command.extend(["--path", scheduler_path])
     
+    if scheduler_cores:
+        command.extend(["--pin-cores", scheduler_cores])
+    
     # Start the Scheduler service
     try:
-        # First, update the config
-        if Path("scripts/update_scheduler_config.py").exists():
-            update_script = "scripts/update_scheduler_config.py"
-        else:
-            update_script = "update_scheduler_config.py"
+        # First, update the config unless nothing has changed since the last update
+        try:
+            applied = SCHEDULER_CONFIG_STAMP.read_text()
+        except OSError:
+            applied = None
         
-        if Path(update_script).exists():
+        if UPDATE_SCHEDULER_SCRIPT and applied == scheduler_config_fingerprint():
+            print("Scheduler configuration is up to date, skipping update")
+        elif UPDATE_SCHEDULER_SCRIPT:
             print("Updating Scheduler configuration...")
-            update_process = subprocess.run(
-                [sys.executable, update_script],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-                check=True
+            update_process = await asyncio.create_subprocess_exec(
+                sys.executable, UPDATE_SCHEDULER_SCRIPT,
+                stdout=asyncio.subprocess.DEVNULL,
+                stderr=asyncio.subprocess.PIPE,
             )
+            _, stderr = await update_process.communicate()
+            if update_process.returncode:
+                raise subprocess.CalledProcessError(
+                    update_process.returncode, UPDATE_SCHEDULER_SCRIPT, stderr=stderr
+                )
+            
+            # The update rewrites the config, so fingerprint it afterwards
+            SCHEDULER_CONFIG_STAMP.write_text(scheduler_config_fingerprint())
         
         # Now start the Scheduler
         print(f"Starting Scheduler service on port {port}...")
         
-        # Use a log file for the Scheduler output
-        log_file = open("scheduler_service.log", "w")
-        
-        scheduler = subprocess.Popen(
-            command,
-            stdout=log_file,
-            stderr=log_file,
-        )
-        
-        # Give it a moment to start
-        time.sleep(2)
+        scheduler = spawn("Scheduler", command)
         
-        # Check if the process is still running
-        if scheduler.poll() is not None:
-            print(f"Error: Scheduler service failed to start. Check scheduler_service.log for details.")
+        # Wait for the service to accept connections
+        if not await wait_ready(port, scheduler):
+            print(f"Error: Scheduler service failed to start. Check {LOG_DIR / 'Scheduler.log'} for details.")
+            signal_group(scheduler, signal.SIGTERM)
             return None
         
         print(f"Scheduler service started. MCP endpoint: http://localhost:{port}/mcp")
@@ -90,93 +326,101 @@ async def start_scheduler(port=5146, scheduler_path=None):
         return None
 
 
-async def start_services(start_webscraper: bool, start_searchengine: bool, start_scheduler: bool, scheduler_port: int = 5146, scheduler_path: str = None):
+async def start_services(start_webscraper: bool, start_searchengine: bool, start_scheduler_flag: bool, scheduler_port: int = 5146, scheduler_path: str = None, verbose: bool = False, scheduler_cores: str = None, searchengine_port: int = 8002):
     """Start the MCP service and servers.
     
     Args:
         start_webscraper: Whether to start the WebScraper server
         start_searchengine: Whether to start the SearchEngine server
-        start_scheduler: Whether to start the Scheduler server
+        start_scheduler_flag: Whether to start the Scheduler server
         scheduler_port: Port for the Scheduler service
         scheduler_path: Path to the Scheduler service executable
+        verbose: Keep uvicorn's INFO logging and access log
+        scheduler_cores: Comma-separated CPUs to pin the Scheduler to
+        searchengine_port: Port for the SearchEngine server
     """
     processes = []
+    pidfds = []
     
     try:
         # Start the MCP service
-        mcp_service = subprocess.Popen(
-            ["uvicorn", "app.main:app", "--host", "0.0.0.0", "--port", "8000"],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.PIPE,
-        )
+        mcp_service = spawn("MCP Service", uvicorn_command("app.main:app", 8000, verbose))
         processes.append(("MCP Service", mcp_service))
-        print("MCP Service started on http://localhost:8000")
+        launches = [wait_started("MCP Service", mcp_service, 8000)]
         
         # Start the WebScraper server if requested
         if start_webscraper:
-            webscraper = subprocess.Popen(
-                ["python", "scripts/webscraper_server.py"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+            webscraper = spawn("WebScraper", ["python", "scripts/webscraper_server.py"])
             processes.append(("WebScraper", webscraper))
             print("WebScraper server started")
         
         # Start the SearchEngine server if requested
         if start_searchengine:
-            searchengine = subprocess.Popen(
-                ["uvicorn", "scripts.search_server:app", "--host", "0.0.0.0", "--port", "8002"],
-                stdout=subprocess.PIPE,
-                stderr=subprocess.PIPE,
-            )
+            searchengine = spawn("SearchEngine", uvicorn_command("scripts.search_server:app", searchengine_port, verbose))
             processes.append(("SearchEngine", searchengine))
-            print("SearchEngine server started on http://localhost:8002")
+            launches.append(wait_started("SearchEngine", searchengine, searchengine_port))
         
         # Start the Scheduler service if requested
-        if start_scheduler:
-            scheduler_result = await start_scheduler(scheduler_port, scheduler_path)
-            if scheduler_result:
-                processes.append(scheduler_result)
+        if start_scheduler_flag:
+            launches.append(start_scheduler(scheduler_port, scheduler_path, scheduler_cores))
+        
+        # Wait for all services to come up concurrently
+        results = await asyncio.gather(*launches)
+        
+        if start_scheduler_flag and results[-1]:
+            processes.append(results[-1])
         
         print("\nPress Ctrl+C to stop all services\n")
         
-        # Wait indefinitely
+        # Sleep until a child exits or we are asked to stop
+        loop = asyncio.get_running_loop()
+        wake = asyncio.Event()
+        shutdown = asyncio.Event()
+        
+        def request_shutdown():
+            shutdown.set()
+            wake.set()
+        
+        pidfds = watch_exits(loop, processes, wake.set)
+        for sig in SHUTDOWN_SIGNALS:
+            loop.add_signal_handler(sig, request_shutdown)
+        
+        # Check once for children that exited during startup
+        wake.set()
+        
         while True:
-            await asyncio.sleep(1)
+            await wake.wait()
+            wake.clear()
+            
+            if shutdown.is_set():
+                print("\nStopping services...")
+                return
             
-            # Check if any process has terminated
+            # Check which process has terminated
             for name, process in processes:
                 if process.poll() is not None:
                     print(f"{name} terminated unexpectedly with code {process.returncode}")
                     
-                    # Print stderr if available
-                    if hasattr(process, 'stderr') and process.stderr:
-                        stderr = process.stderr.read().decode()
-                        if stderr:
-                            print(f"{name} stderr:")
-                            print(stderr)
-                    
-                    # Terminate all processes
-                    for _, p in processes:
-                        if p.poll() is None:
-                            p.terminate()
+                    # Print the end of the service log
+                    output = tail_log(name)
+                    if output:
+                        print(f"{name} output:")
+                        print(output)
                     
+                    # The remaining processes are stopped below
                     return
     
     except KeyboardInterrupt:
         print("\nStopping services...")
     
     finally:
+        loop = asyncio.get_running_loop()
+        unwatch_exits(loop, pidfds)
+        for sig in SHUTDOWN_SIGNALS:
+            loop.remove_signal_handler(sig)
+        
         # Terminate all processes
-        for name, process in processes:
-            if process.poll() is None:
-                print(f"Terminating {name}...")
-                process.terminate()
-                try:
-                    process.wait(timeout=5)
-                except subprocess.TimeoutExpired:
-                    print(f"Force killing {name}...")
-                    process.kill()
+        stop_processes(processes)
 
 
 def main():
@@ -192,6 +436,12 @@ def main():
         action="store_true",
         help="Start the SearchEngine server"
     )
+    parser.add_argument(
+        "--searchengine-port", 
+        type=int, 
+        default=8002,
+        help="Port for the SearchEngine server (default: 8002)"
+    )
     parser.add_argument(
         "--scheduler", 
         action="store_true",
@@ -208,11 +458,21 @@ def main():
         type=str,
         help="Path to the Scheduler service executable"
     )
+    parser.add_argument(
+        "--scheduler-cores", 
+        type=str,
+        help="Comma-separated CPUs to pin the Scheduler service to, e.g. 2,3 (Linux only)"
+    )
     parser.add_argument(
         "--all", 
         action="store_true",
         help="Start all servers"
     )
+    parser.add_argument(
+        "--verbose", 
+        action="store_true",
+        help="Run uvicorn at INFO level with access logging"
+    )
     
     args = parser.parse_args()
     
@@ -232,7 +492,10 @@ def main():
         args.searchengine, 
         args.scheduler,
         args.scheduler_port,
-        args.scheduler_path
+        args.scheduler_path,
+        args.verbose,
+        args.scheduler_cores,
+        args.searchengine_port
     ))
 
 
@@ -4,13 +4,18 @@ Test script for MCP Service functionality.
 """
 
 import asyncio
-import json
 import sys
-from datetime import datetime
+
+from scripts import run
 
 # Set the base URL for the API
 BASE_URL = "http://localhost:8000/api"
 
+# Request bodies shared by every run
+CREDENTIALS = {"username": "admin", "password": "adminpassword"}
+FIRST_MESSAGE = {"message": "Please search for information about artificial intelligence."}
+FOLLOW_UP_MESSAGE = {"message": "What can you tell me about machine learning?"}
+
 async def test_mcp_service():
     """Test the MCP service functionality."""
     print("=" * 50)
@@ -22,15 +27,19 @@ async def test_mcp_service():
         import httpx
         
         # 1. Check health endpoint
-        async with httpx.AsyncClient() as client:
+        async with httpx.AsyncClient(
+            base_url=BASE_URL,
+            http2=True,
+            limits=httpx.Limits(max_keepalive_connections=8, max_connections=8),
+            timeout=httpx.Timeout(10.0, connect=2.0),
+        ) as client:
             print("\n1. Testing health endpoint...")
             print("-" * 30)
-            response = await client.get(f"{BASE_URL}/health")
+            response = await client.get("/health")
             print(f"Status: {response.status_code}")
-            print(f"Response: {response.json()}")
             
             if response.status_code != 200:
-                print("❌ Health check failed!")
+                print(f"❌ Health check failed! {response.text}")
                 return False
             
             print("✅ Health check passed!")
@@ -39,9 +48,8 @@ async def test_mcp_service():
             print("\n1.5. Authenticating...")
             print("-" * 30)
             response = await client.post(
-                f"{BASE_URL}/auth/token",
-                data={"username": "admin", "password": "adminpassword"},
-                headers={"Content-Type": "application/x-www-form-urlencoded"}
+                "/auth/token",
+                data=CREDENTIALS
             )
             print(f"Status: {response.status_code}")
             
@@ -55,79 +63,64 @@ async def test_mcp_service():
             
             print(f"✅ Authentication successful! Got token.")
             
-            # Add authorization header for subsequent requests
-            auth_header = {"Authorization": f"{token_type} {token}"}
+            # Send the authorization header with all subsequent requests
+            client.headers["Authorization"] = f"{token_type} {token}"
             
             # Continue with other tests...
             # 2. Create a new conversation
             print("\n2. Creating new conversation...")
             print("-" * 30)
-            response = await client.post(
-                f"{BASE_URL}/conversations",
-                json={"message": "Please search for information about artificial intelligence."},
-                headers=auth_header
-            )
+            response = await client.post("/conversations", json=FIRST_MESSAGE)
             print(f"Status: {response.status_code}")
-            print(f"Response: {response.json()}")
             
             if response.status_code != 200:
-                print("❌ Conversation creation failed!")
+                print(f"❌ Conversation creation failed! {response.text}")
                 return False
             
             conversation_id = response.json()["conversation_id"]
+            conversation_path = f"/conversations/{conversation_id}"
             print(f"✅ Conversation created with ID: {conversation_id}")
             
-            # 3. Get the conversation
-            print(f"\n3. Getting conversation {conversation_id}...")
+            # 3-5. Get the conversation, add a message and list conversations.
+            # None of these depend on each other, so issue them concurrently.
+            print(f"\n3-5. Getting, messaging and listing conversation {conversation_id}...")
             print("-" * 30)
-            response = await client.get(f"{BASE_URL}/conversations/{conversation_id}")
-            print(f"Status: {response.status_code}")
-            print(f"Response (truncated): {response.json()['id']}")
+            get_response, message_response, list_response = await asyncio.gather(
+                client.get(conversation_path),
+                client.post(f"{conversation_path}/messages", json=FOLLOW_UP_MESSAGE),
+                client.get("/conversations"),
+            )
             
-            if response.status_code != 200:
-                print("❌ Conversation retrieval failed!")
+            print(f"Get status: {get_response.status_code}")
+            if get_response.status_code != 200:
+                print(f"❌ Conversation retrieval failed! {get_response.text}")
                 return False
             
             print("✅ Conversation retrieved successfully!")
             
-            # 4. Add a message to the conversation
-            print(f"\n4. Adding message to conversation {conversation_id}...")
-            print("-" * 30)
-            response = await client.post(
-                f"{BASE_URL}/conversations/{conversation_id}/messages",
-                json={"message": "What can you tell me about machine learning?"}
-            )
-            print(f"Status: {response.status_code}")
-            print(f"Response: {response.json()['conversation_id']}")
-            
-            if response.status_code != 200:
-                print("❌ Message addition failed!")
+            print(f"Message status: {message_response.status_code}")
+            if message_response.status_code != 200:
+                print(f"❌ Message addition failed! {message_response.text}")
                 return False
             
             print("✅ Message added successfully!")
             
-            # 5. List all conversations
-            print("\n5. Listing all conversations...")
-            print("-" * 30)
-            response = await client.get(f"{BASE_URL}/conversations")
-            print(f"Status: {response.status_code}")
-            print(f"Response: {len(response.json()['conversations'])} conversations found")
-            
-            if response.status_code != 200:
-                print("❌ Conversation listing failed!")
+            print(f"List status: {list_response.status_code}")
+            if list_response.status_code != 200:
+                print(f"❌ Conversation listing failed! {list_response.text}")
                 return False
             
+            print(f"Response: {len(list_response.json()['conversations'])} conversations found")
             print("✅ Conversations listed successfully!")
             
             # 6. Delete the conversation
             print(f"\n6. Deleting conversation {conversation_id}...")
             print("-" * 30)
-            response = await client.delete(f"{BASE_URL}/conversations/{conversation_id}")
+            response = await client.delete(conversation_path)
             print(f"Status: {response.status_code}")
-            print(f"Response: {response.json()}")
             
             if response.status_code != 200:
-                print("❌ Conversation deletion failed!")
+                print(f"❌ Conversation deletion failed! {response.text}")
                 return False
             
             print("✅ Conversation deleted successfully!")
@@ -143,7 +136,7 @@ async def test_mcp_service():
 
 if __name__ == "__main__":
     try:
-        result = asyncio.run(test_mcp_service())
+        result = run(test_mcp_service())
         sys.exit(0 if result else 1)
     except Exception as e:
         print(f"Error during test: {e}")
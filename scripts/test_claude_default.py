@@ -6,12 +6,19 @@ for all clients in the MCP Host service.
 
 import argparse
 import asyncio
+import base64
 import json
 import logging
 import os
+import time
+from dataclasses import dataclass
+from pathlib import Path
 from typing import Dict, List, Optional, Any
 
 import aiohttp
+import orjson
+
+from scripts import run
 
 logging.basicConfig(
     level=logging.INFO,
@@ -25,160 +32,273 @@ API_ENDPOINTS = {
     "health": "/health",
     "models": "/api/models",
     "conversations": "/api/conversations",
-    "messages": lambda conv_id: f"/api/conversations/{conv_id}/messages",
 }
 
 # Default credentials
 DEFAULT_USERNAME = "admin@example.com"
 DEFAULT_PASSWORD = "password"
 
+# Tokens are cached between runs until shortly before they expire
+TOKEN_CACHE_FILE = Path.home() / ".cache" / "mcp_test_token.json"
+TOKEN_EXPIRY_MARGIN = 30
+
+
+class TokenRejectedError(Exception):
+    """Raised when the service answers 401 to a request carrying a token."""
+
+
+def _token_expiry(token: str) -> float:
+    """Read the exp claim of a JWT without verifying its signature."""
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        return float(json.loads(base64.urlsafe_b64decode(payload))["exp"])
+    except (IndexError, KeyError, TypeError, ValueError):
+        return 0.0
+
+
+def _read_token_cache() -> Dict[str, str]:
+    """Read the cached tokens, keyed by user and host."""
+    try:
+        return json.loads(TOKEN_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
 
-async def get_token(host: str, username: str, password: str) -> str:
-    """Get the authorization token."""
+
+def _write_token_cache(cache: Dict[str, str]) -> None:
+    """Atomically write the token cache, readable only by the current user."""
+    TOKEN_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+    tmp_path = TOKEN_CACHE_FILE.with_suffix(".tmp")
+    
+    fd = os.open(tmp_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o600)
+    with os.fdopen(fd, "w") as f:
+        json.dump(cache, f)
+    
+    os.replace(tmp_path, TOKEN_CACHE_FILE)
+
+
+@dataclass(frozen=True)
+class Endpoints:
+    """API endpoint URLs for a host, built once per run."""
+    
+    health: str
+    models: str
+    conversations: str
+    
+    @classmethod
+    def for_host(cls, host: str) -> "Endpoints":
+        """Resolve the API endpoints against a host URL."""
+        return cls(**{name: f"{host}{path}" for name, path in API_ENDPOINTS.items()})
+    
+    def messages(self, conversation_id: str) -> str:
+        """URL for the messages of a conversation."""
+        return f"{self.conversations}/{conversation_id}/messages"
+
+
+class LazyJson:
+    """Defer pretty-printing an object as JSON until a log record is emitted."""
+    
+    __slots__ = ("obj",)
+    
+    def __init__(self, obj: Any):
+        self.obj = obj
+    
+    def __str__(self) -> str:
+        return orjson.dumps(self.obj, option=orjson.OPT_INDENT_2).decode()
+
+
+async def read_json(response: aiohttp.ClientResponse) -> Any:
+    """Decode a JSON response body with orjson."""
+    return orjson.loads(await response.read())
+
+
+def dump_json(obj: Any) -> str:
+    """Encode a JSON request body with orjson."""
+    return orjson.dumps(obj).decode()
+
+
+def create_session() -> aiohttp.ClientSession:
+    """Create the HTTP session shared by all requests of a run.
+    
+    Connections are kept alive between requests and host lookups are
+    cached, so only the first request to the host pays for DNS and connect.
+    """
+    connector = aiohttp.TCPConnector(
+        limit=100,
+        limit_per_host=20,
+        use_dns_cache=True,
+        ttl_dns_cache=300,
+        keepalive_timeout=30,
+        enable_cleanup_closed=True,
+    )
+    return aiohttp.ClientSession(connector=connector, json_serialize=dump_json)
+
+
+async def get_token(
+    session: aiohttp.ClientSession, host: str, username: str, password: str, refresh: bool = False
+) -> str:
+    """Get the authorization token, reusing a cached one until it expires.
+    
+    Args:
+        session: HTTP session
+        host: Host URL
+        username: Username
+        password: Password
+        refresh: Ignore and replace the cached token, e.g. after the service
+            rejected it
+    """
+    cache_key = f"{username}@{host}"
+    cache = _read_token_cache()
+    token = cache.get(cache_key)
+    if not refresh and token and _token_expiry(token) > time.time() + TOKEN_EXPIRY_MARGIN:
+        return token
+    
     url = f"{host}/api/token"
     
-    async with aiohttp.ClientSession() as session:
-        data = {
-            "username": username,
-            "password": password,
-        }
-        async with session.post(url, data=data) as response:
-            if response.status != 200:
-                text = await response.text()
-                raise Exception(f"Failed to get token: {text}")
-            
-            result = await response.json()
-            return result["access_token"]
+    data = {
+        "username": username,
+        "password": password,
+    }
+    async with session.post(url, data=data) as response:
+        if response.status != 200:
+            text = await response.text()
+            raise Exception(f"Failed to get token: {text}")
+        
+        result = await read_json(response)
+    
+    cache[cache_key] = result["access_token"]
+    _write_token_cache(cache)
+    return result["access_token"]
 
 
-async def check_health(host: str) -> bool:
+async def check_health(session: aiohttp.ClientSession, endpoints: Endpoints) -> bool:
     """Check if the service is healthy."""
-    url = f"{host}{API_ENDPOINTS['health']}"
-    
-    async with aiohttp.ClientSession() as session:
-        async with session.get(url) as response:
-            if response.status != 200:
-                return False
-            
-            result = await response.json()
-            return result.get("status") == "ok"
+    async with session.get(endpoints.health) as response:
+        if response.status != 200:
+            return False
+        
+        result = await read_json(response)
+        return result.get("status") == "ok"
 
 
-async def get_available_models(host: str, token: str) -> Dict[str, Any]:
+async def get_available_models(
+    session: aiohttp.ClientSession, endpoints: Endpoints, headers: Dict[str, str]
+) -> Dict[str, Any]:
     """Get available models."""
-    url = f"{host}{API_ENDPOINTS['models']}"
-    
-    async with aiohttp.ClientSession() as session:
-        headers = {"Authorization": f"Bearer {token}"}
-        async with session.get(url, headers=headers) as response:
-            if response.status != 200:
-                text = await response.text()
-                raise Exception(f"Failed to get models: {text}")
-            
-            return await response.json()
+    async with session.get(endpoints.models, headers=headers) as response:
+        if response.status == 401:
+            raise TokenRejectedError(await response.text())
+        if response.status != 200:
+            text = await response.text()
+            raise Exception(f"Failed to get models: {text}")
+        
+        return await read_json(response)
 
 
 async def create_conversation(
-    host: str, token: str, message: Optional[str] = None, provider_name: Optional[str] = None
+    session: aiohttp.ClientSession, endpoints: Endpoints, headers: Dict[str, str], message: Optional[str] = None, provider_name: Optional[str] = None
 ) -> Dict[str, Any]:
     """Create a new conversation."""
-    url = f"{host}{API_ENDPOINTS['conversations']}"
-    
     data = {}
     if message:
         data["message"] = message
     if provider_name:
         data["provider_name"] = provider_name
     
-    async with aiohttp.ClientSession() as session:
-        headers = {"Authorization": f"Bearer {token}"}
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status != 200:
-                text = await response.text()
-                raise Exception(f"Failed to create conversation: {text}")
-            
-            return await response.json()
+    async with session.post(endpoints.conversations, json=data, headers=headers) as response:
+        if response.status != 200:
+            text = await response.text()
+            raise Exception(f"Failed to create conversation: {text}")
+        
+        return await read_json(response)
 
 
 async def add_message(
-    host: str, token: str, conversation_id: str, message: str, provider_name: Optional[str] = None
+    session: aiohttp.ClientSession, endpoints: Endpoints, headers: Dict[str, str], conversation_id: str, message: str, provider_name: Optional[str] = None
 ) -> Dict[str, Any]:
     """Add a message to a conversation."""
-    url = f"{host}{API_ENDPOINTS['messages'](conversation_id)}"
+    url = endpoints.messages(conversation_id)
     
     data = {"message": message}
     if provider_name:
         data["provider_name"] = provider_name
     
-    async with aiohttp.ClientSession() as session:
-        headers = {"Authorization": f"Bearer {token}"}
-        async with session.post(url, json=data, headers=headers) as response:
-            if response.status != 200:
-                text = await response.text()
-                raise Exception(f"Failed to add message: {text}")
-            
-            return await response.json()
+    async with session.post(url, json=data, headers=headers) as response:
+        if response.status != 200:
+            text = await response.text()
+            raise Exception(f"Failed to add message: {text}")
+        
+        return await read_json(response)
 
 
 async def test_default_provider(host: str, username: str, password: str) -> None:
     """Test that Claude Sonnet 4 is the default provider."""
-    logger.info("Getting token...")
-    token = await get_token(host, username, password)
-    
-    logger.info("Checking health...")
-    health = await check_health(host)
-    logger.info(f"Health check: {'OK' if health else 'FAILED'}")
-    
-    if not health:
-        logger.error("Service is not healthy, exiting.")
-        return
-    
-    logger.info("Getting available models...")
-    models = await get_available_models(host, token)
-    logger.info(f"Available models: {json.dumps(models, indent=2)}")
-    
-    # Check default provider
-    default_provider = models.get("default_provider")
-    logger.info(f"Default provider: {default_provider}")
-    
-    # Find provider info for the default provider
-    default_provider_info = None
-    for provider in models.get("providers", []):
-        if provider.get("name") == default_provider:
-            default_provider_info = provider
-            break
-    
-    if default_provider_info:
-        logger.info(f"Default provider info: {json.dumps(default_provider_info, indent=2)}")
+    endpoints = Endpoints.for_host(host)
+    async with create_session() as session:
+        # The health check does not need the token, so run both together
+        logger.info("Getting token and checking health...")
+        token, health = await asyncio.gather(
+            get_token(session, host, username, password),
+            check_health(session, endpoints),
+        )
+        headers = {"Authorization": f"Bearer {token}"}
+        logger.info(f"Health check: {'OK' if health else 'FAILED'}")
+        
+        if not health:
+            logger.error("Service is not healthy, exiting.")
+            return
+        
+        logger.info("Getting available models...")
+        try:
+            models = await get_available_models(session, endpoints, headers)
+        except TokenRejectedError:
+            # A cached token outlives a server restart with a new signing key;
+            # replace it and retry once
+            logger.info("Token was rejected, re-authenticating...")
+            token = await get_token(session, host, username, password, refresh=True)
+            headers = {"Authorization": f"Bearer {token}"}
+            models = await get_available_models(session, endpoints, headers)
+        logger.info("Available models: %s", LazyJson(models))
+        
+        # Check default provider
+        default_provider = models.get("default_provider")
+        logger.info(f"Default provider: {default_provider}")
+        
+        # Find provider info for the default provider
+        providers_by_name = {provider.get("name"): provider for provider in models.get("providers", [])}
+        default_provider_info = providers_by_name.get(default_provider)
         
-        # Check if it's Anthropic Claude Sonnet 4
-        is_claude_sonnet = (
-            default_provider_info.get("provider_type") == "anthropic" and
-            "claude-sonnet" in default_provider_info.get("model_id", "").lower()
+        if default_provider_info:
+            logger.info("Default provider info: %s", LazyJson(default_provider_info))
+            
+            # Check if it's Anthropic Claude Sonnet 4
+            is_claude_sonnet = (
+                default_provider_info.get("provider_type") == "anthropic" and
+                "claude-sonnet" in default_provider_info.get("model_id", "").lower()
+            )
+            
+            if is_claude_sonnet:
+                logger.info("✅ SUCCESS: Default provider is Claude Sonnet 4!")
+            else:
+                logger.warning("❌ WARNING: Default provider is not Claude Sonnet 4!")
+        else:
+            logger.warning(f"Could not find info for default provider: {default_provider}")
+        
+        # Test conversation without specifying provider
+        logger.info("Creating conversation without specifying provider...")
+        conversation = await create_conversation(
+            session, endpoints, headers, message="What provider are you using?"
         )
         
-        if is_claude_sonnet:
-            logger.info("✅ SUCCESS: Default provider is Claude Sonnet 4!")
+        logger.info(f"Conversation created with ID: {conversation.get('conversation_id')}")
+        logger.info(f"Response: {conversation.get('message')}")
+        logger.info(f"Provider used: {conversation.get('provider_used')}")
+        
+        # Check if the provider used is anthropic
+        if conversation.get("provider_used") == "anthropic":
+            logger.info("✅ SUCCESS: Conversation used Anthropic provider by default!")
         else:
-            logger.warning("❌ WARNING: Default provider is not Claude Sonnet 4!")
-    else:
-        logger.warning(f"Could not find info for default provider: {default_provider}")
-    
-    # Test conversation without specifying provider
-    logger.info("Creating conversation without specifying provider...")
-    conversation = await create_conversation(
-        host, token, message="What provider are you using?"
-    )
-    
-    logger.info(f"Conversation created with ID: {conversation.get('conversation_id')}")
-    logger.info(f"Response: {conversation.get('message')}")
-    logger.info(f"Provider used: {conversation.get('provider_used')}")
-    
-    # Check if the provider used is anthropic
-    if conversation.get("provider_used") == "anthropic":
-        logger.info("✅ SUCCESS: Conversation used Anthropic provider by default!")
-    else:
-        logger.warning(f"❌ WARNING: Conversation used {conversation.get('provider_used')} instead of Anthropic!")
+            logger.warning(f"❌ WARNING: Conversation used {conversation.get('provider_used')} instead of Anthropic!")
 
 
 async def main():
@@ -199,4 +319,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
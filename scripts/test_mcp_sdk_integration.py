@@ -14,13 +14,14 @@ import asyncio
 import json
 import logging
 import sys
+from contextlib import AsyncExitStack
+from functools import lru_cache
 from pathlib import Path
 from typing import Dict, List, Any, Optional
 
-sys.path.append(str(Path(__file__).parent.parent))
-
 from app.config.config import load_config, AppConfig, MCPServerConfig
 from app.host.mcp_client import MCPSdkClient
+from scripts import run
 
 # Configure logging
 logging.basicConfig(
@@ -31,32 +32,105 @@ logger = logging.getLogger(__name__)
 
 CONFIG_FILE = Path("config/config.json")
 
+# Connected clients, keyed by the JSON of their server configuration
+_clients: Dict[str, MCPSdkClient] = {}
+
+
+@lru_cache(maxsize=4)
+def _load_config(path: str, mtime: float) -> AppConfig:
+    """Load the configuration, cached until its modification time changes.
+    
+    Args:
+        path: Path to the configuration file
+        mtime: Modification time of the file, used as part of the cache key
+    
+    Returns:
+        Application configuration
+    """
+    return load_config(path)
+
+
+def load_config_cached(config_path: Path) -> AppConfig:
+    """Load the configuration, reusing it while the file is unchanged.
+    
+    Args:
+        config_path: Path to the configuration file
+    
+    Returns:
+        Application configuration
+    """
+    try:
+        mtime = config_path.stat().st_mtime
+    except OSError:
+        # load_config writes a default config for a missing file
+        return load_config(config_path)
+    
+    return _load_config(str(config_path), mtime)
+
+
+async def _connect(server_config: MCPServerConfig) -> MCPSdkClient:
+    """Create and connect a client for an MCP server."""
+    client = MCPSdkClient(server_config)
+    await client.initialize()
+    return client
 
-async def test_mcp_server(server_config: MCPServerConfig) -> None:
-    """Test connectivity and functionality of an MCP server.
+
+async def _close_client(key: str, client: MCPSdkClient) -> None:
+    """Close a client opened through get_client(), logging any failure."""
+    _clients.pop(key, None)
+    try:
+        await client.close()
+    except Exception as e:
+        logger.error(f"Error closing client for {client.name}: {e}", exc_info=True)
+
+
+async def get_client(
+    server_config: MCPServerConfig, stack: AsyncExitStack
+) -> MCPSdkClient:
+    """Get a connected client for an MCP server, reusing earlier connections.
+    
+    The MCP SDK transports run in anyio cancel scopes, which must be exited by
+    the task that entered them. New clients are therefore connected in the
+    calling task and closed by the exit stack owned by that same task.
+    
+    Args:
+        server_config: Configuration for the MCP server
+        stack: Exit stack that closes the client when it unwinds
+    
+    Returns:
+        Connected client
+    """
+    key = server_config.model_dump_json()
+    client = _clients.get(key)
+    if client is None:
+        client = await _connect(server_config)
+        _clients[key] = client
+        stack.push_async_callback(_close_client, key, client)
+    
+    return client
+
+
+async def test_mcp_server(server_config: MCPServerConfig, client: MCPSdkClient) -> None:
+    """Test the functionality of a connected MCP server.
     
     Args:
         server_config: Configuration for the MCP server
+        client: Client connected to the server
     """
     logger.info(f"Testing MCP server: {server_config.name}")
     
     try:
-        # Initialize the client
-        client = MCPSdkClient(server_config)
-        await client.initialize()
-        logger.info(f"Successfully connected to {server_config.name}")
-        
         # List tools
         tools = await client.list_tools()
         logger.info(f"Found {len(tools)} tools on {server_config.name}:")
         for tool in tools:
-            logger.info(f"  - {tool['name']}: {tool['description']}")
+            logger.info(f"  - [{server_config.name}] {tool['name']}: {tool['description']}")
         
         # List resources
         resources = await client.list_resources()
         logger.info(f"Found {len(resources)} resources on {server_config.name}:")
         for resource in resources:
-            logger.info(f"  - {resource['name']}: {resource['description']}")
+            logger.info(f"  - [{server_config.name}] {resource['name']}: {resource['description']}")
         
         # Try calling a simple tool if available
         if tools:
@@ -74,8 +148,6 @@ async def test_mcp_server(server_config: MCPServerConfig) -> None:
             else:
                 logger.info(f"No simple tools available for testing on {server_config.name}")
         
-        # Close the client
-        await client.close()
         logger.info(f"Successfully completed tests for {server_config.name}")
     
     except Exception as e:
@@ -93,7 +165,7 @@ async def test_all_servers(config_path: Path, server_name: Optional[str] = None)
     
     try:
         # Load configuration
-        config = load_config(config_path)
+        config = load_config_cached(config_path)
         
         if not config.mcp or not config.mcp.mcp_servers:
             logger.warning("No MCP servers configured")
@@ -109,9 +181,23 @@ async def test_all_servers(config_path: Path, server_name: Optional[str] = None)
         
         logger.info(f"Testing {len(servers)} MCP servers")
         
-        # Test each server sequentially
-        for server_config in servers:
-            await test_mcp_server(server_config)
+        async with AsyncExitStack() as stack:
+            # Connect in this task so the same task closes every client
+            connected = []
+            for server_config in servers:
+                try:
+                    client = await get_client(server_config, stack)
+                except Exception as e:
+                    logger.error(f"Error connecting to {server_config.name}: {e}", exc_info=True)
+                    continue
+                logger.info(f"Successfully connected to {server_config.name}")
+                connected.append((server_config, client))
+            
+            # Test the servers concurrently; test_mcp_server logs its own errors
+            await asyncio.gather(
+                *(test_mcp_server(server_config, client) for server_config, client in connected),
+                return_exceptions=True,
+            )
     
     except Exception as e:
         logger.error(f"Error loading configuration: {e}", exc_info=True)
@@ -134,7 +220,7 @@ def main() -> int:
     args = parser.parse_args()
     
     try:
-        asyncio.run(test_all_servers(Path(args.config), args.server))
+        run(test_all_servers(Path(args.config), args.server))
         return 0
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=True)
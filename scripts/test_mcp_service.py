@@ -16,73 +16,80 @@ from typing import Dict, List, Optional
 
 import httpx
 
+from scripts import run
+
 
 async def create_conversation(
-    base_url: str, initial_message: Optional[str] = None
+    client: httpx.AsyncClient, initial_message: Optional[str] = None
 ) -> Dict:
     """Create a new conversation.
     
     Args:
-        base_url: Base URL of the MCP service
+        client: HTTP client bound to the MCP service's base URL
         initial_message: Optional initial message
         
     Returns:
         Conversation data
     """
-    url = f"{base_url}/assistant/conversations"
-    
     data = {}
     if initial_message:
         data["message"] = initial_message
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=data)
-        response.raise_for_status()
-        
-        return response.json()
+    response = await client.post("/assistant/conversations", json=data)
+    response.raise_for_status()
+    
+    return response.json()
 
 
 async def add_message(
-    base_url: str, conversation_id: str, message: str
+    client: httpx.AsyncClient, conversation_id: str, message: str
 ) -> Dict:
     """Add a message to a conversation.
     
     Args:
-        base_url: Base URL of the MCP service
+        client: HTTP client bound to the MCP service's base URL
         conversation_id: Conversation ID
         message: Message content
         
     Returns:
         Response data
     """
-    url = f"{base_url}/assistant/conversations/{conversation_id}/messages"
+    url = f"/assistant/conversations/{conversation_id}/messages"
     
     data = {"message": message}
     
-    async with httpx.AsyncClient() as client:
-        response = await client.post(url, json=data)
-        response.raise_for_status()
-        
-        return response.json()
+    response = await client.post(url, json=data)
+    response.raise_for_status()
+    
+    return response.json()
 
 
-async def get_conversation(base_url: str, conversation_id: str) -> Dict:
+async def get_conversation(client: httpx.AsyncClient, conversation_id: str) -> Dict:
     """Get a conversation.
     
     Args:
-        base_url: Base URL of the MCP service
+        client: HTTP client bound to the MCP service's base URL
         conversation_id: Conversation ID
         
     Returns:
         Conversation data
     """
-    url = f"{base_url}/assistant/conversations/{conversation_id}"
+    response = await client.get(f"/assistant/conversations/{conversation_id}")
+    response.raise_for_status()
     
-    async with httpx.AsyncClient() as client:
-        response = await client.get(url)
-        response.raise_for_status()
+    return response.json()
+
+
+async def ainput(prompt: str) -> str:
+    """Read a line of input without blocking the event loop.
+    
+    Args:
+        prompt: Prompt to display
         
-        return response.json()
+    Returns:
+        The line entered by the user
+    """
+    return await asyncio.to_thread(input, prompt)
 
 
 async def interactive_session(base_url: str):
@@ -97,31 +104,37 @@ async def interactive_session(base_url: str):
     print("-" * 40)
     
     # Create a new conversation
-    initial_message = input("You: ")
+    initial_message = await ainput("You: ")
     
     if initial_message.lower() == "exit":
         return
     
-    print("Creating conversation...")
-    conversation = await create_conversation(base_url, initial_message)
-    
-    conversation_id = conversation["conversation_id"]
-    print(f"Conversation ID: {conversation_id}")
-    
-    if "message" in conversation:
-        print(f"Assistant: {conversation['message']}")
-    
-    # Interactive loop
-    while True:
-        user_input = input("You: ")
+    async with httpx.AsyncClient(
+        base_url=base_url,
+        http2=True,
+        limits=httpx.Limits(max_connections=32, max_keepalive_connections=16),
+        timeout=60,
+    ) as client:
+        print("Creating conversation...")
+        conversation = await create_conversation(client, initial_message)
         
-        if user_input.lower() == "exit":
-            break
+        conversation_id = conversation["conversation_id"]
+        print(f"Conversation ID: {conversation_id}")
         
-        print("Sending message...")
-        response = await add_message(base_url, conversation_id, user_input)
+        if "message" in conversation:
+            print(f"Assistant: {conversation['message']}")
         
-        print(f"Assistant: {response['message']}")
+        # Interactive loop
+        while True:
+            user_input = await ainput("You: ")
+            
+            if user_input.lower() == "exit":
+                break
+            
+            print("Sending message...")
+            response = await add_message(client, conversation_id, user_input)
+            
+            print(f"Assistant: {response['message']}")
 
 
 async def main():
@@ -146,4 +159,4 @@ async def main():
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -4,14 +4,19 @@ Test script for MCP Service API with provider-based architecture.
 """
 
 import asyncio
+import io
 import json
 import sys
 from datetime import datetime
 from typing import Dict, List, Optional
+import orjson
 import pytest
 
+from scripts import run
+
 # Set the base URL for the API
 BASE_URL = "http://localhost:8000/api"
+CONVERSATIONS_URL = f"{BASE_URL}/conversations"
 
 # Auth credentials
 AUTH = {
@@ -20,6 +25,37 @@ AUTH = {
 }
 
 
+async def _run_provider(client, auth_header: Dict[str, str], provider: str) -> Dict[str, Optional[str]]:
+    """Create a conversation with a specific provider.
+    
+    Args:
+        client: HTTP client to send the request with
+        auth_header: Authorization header for the request
+        provider: Name of the provider to test
+        
+    Returns:
+        The conversation ID, message and provider used, or an error
+    """
+    response = await client.post(
+        CONVERSATIONS_URL,
+        json={
+            "message": f"Hello, I am testing the {provider} provider. What model are you?",
+            "provider_name": provider
+        },
+        headers=auth_header
+    )
+    
+    if response.status_code != 200:
+        return {"error": response.text}
+    
+    result = orjson.loads(response.content)
+    return {
+        "conversation_id": result.get("conversation_id"),
+        "message": result.get("message"),
+        "provider_used": result.get("provider_used"),
+    }
+
+
 @pytest.mark.asyncio
 async def test_provider_api():
     """Test the provider-based architecture API for the MCP service."""
@@ -31,7 +67,11 @@ async def test_provider_api():
         # Import httpx inside the function to catch any import errors
         import httpx
         
-        async with httpx.AsyncClient() as client:
+        # Concurrent provider requests share one HTTP/2 connection
+        async with httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(max_connections=4, max_keepalive_connections=4),
+        ) as client:
             # 1. Authenticate to get a token
             print("\n1. Authenticating...")
             print("-" * 30)
@@ -46,7 +86,7 @@ async def test_provider_api():
                 print(f"❌ Authentication failed! {response.text}")
                 return False
             
-            token_data = response.json()
+            token_data = orjson.loads(response.content)
             token = token_data.get("access_token")
             token_type = token_data.get("token_type", "bearer")
             
@@ -68,7 +108,7 @@ async def test_provider_api():
                 print(f"❌ Failed to list model providers! {response.text}")
                 return False
             
-            models_data = response.json()
+            models_data = orjson.loads(response.content)
             print(f"Default provider: {models_data.get('default_provider')}")
             print("Available providers:")
             for provider in models_data.get("providers", []):
@@ -85,31 +125,34 @@ async def test_provider_api():
             print("\n3. Creating conversations with different providers...")
             print("-" * 30)
             
-            for provider in providers:
-                print(f"\nTesting provider: {provider}")
-                response = await client.post(
-                    f"{BASE_URL}/conversations",
-                    json={
-                        "message": f"Hello, I am testing the {provider} provider. What model are you?",
-                        "provider_name": provider
-                    },
-                    headers=auth_header
-                )
+            # The providers are independent, so test them concurrently
+            results = await asyncio.gather(
+                *(_run_provider(client, auth_header, provider) for provider in providers),
+                return_exceptions=True,
+            )
+            
+            # Collect the per-provider report and write it out in one go
+            output = io.StringIO()
+            for provider, result in zip(providers, results):
+                print(f"\nTesting provider: {provider}", file=output)
                 
-                if response.status_code != 200:
-                    print(f"❌ Failed to create conversation with provider {provider}! {response.text}")
+                if isinstance(result, Exception):
+                    print(f"❌ Error testing provider {provider}: {result}", file=output)
                     continue
                 
-                result = response.json()
-                conversation_id = result.get("conversation_id")
-                message = result.get("message")
-                provider_used = result.get("provider_used")
+                if "error" in result:
+                    print(f"❌ Failed to create conversation with provider {provider}! {result['error']}", file=output)
+                    continue
                 
-                print(f"Created conversation: {conversation_id}")
-                print(f"Provider used: {provider_used}")
-                print(f"Response preview: {message[:100]}..." if message and len(message) > 100 else f"Response: {message}")
+                message = result["message"]
+                print(f"Created conversation: {result['conversation_id']}", file=output)
+                print(f"Provider used: {result['provider_used']}", file=output)
+                print(f"Response preview: {message[:100]}..." if message and len(message) > 100 else f"Response: {message}", file=output)
                 
-                print(f"✅ Successfully tested provider {provider}")
+                print(f"✅ Successfully tested provider {provider}", file=output)
+            
+            sys.stdout.write(output.getvalue())
+            sys.stdout.flush()
             
             print("\n✅ All provider tests completed!")
             return True
@@ -120,5 +163,5 @@ async def test_provider_api():
 
 
 if __name__ == "__main__":
-    result = asyncio.run(test_provider_api())
+    result = run(test_provider_api())
     sys.exit(0 if result else 1)
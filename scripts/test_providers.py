@@ -4,14 +4,29 @@
 import asyncio
 import json
 import os
-import sys
 from typing import Dict, List, Any
 
-# Add parent directory to path to import from app
-sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-
 from app.config.config import ModelConfig, ModelProviderType
 from app.model.provider import get_provider
+from scripts import run
+
+
+async def run_provider_call(config: ModelConfig, coro: Any) -> Any:
+    """Await a provider coroutine, on a worker thread for local models.
+    
+    Loading and running a HuggingFace model is CPU- and disk-bound work that
+    would otherwise stall the API-backed providers running alongside it.
+    
+    Args:
+        config: Model configuration of the provider
+        coro: Provider coroutine to run
+        
+    Returns:
+        Result of the coroutine
+    """
+    if config.provider == ModelProviderType.HUGGINGFACE:
+        return await asyncio.to_thread(asyncio.run, coro)
+    return await coro
 
 
 async def test_provider(config: ModelConfig, messages: List[Dict[str, Any]]) -> None:
@@ -21,27 +36,28 @@ async def test_provider(config: ModelConfig, messages: List[Dict[str, Any]]) ->
         config: Model configuration
         messages: List of message dictionaries
     """
-    print(f"\n--- Testing {config.provider}:{config.model_id} ---")
+    label = f"{config.provider}:{config.model_id}"
+    print(f"\n--- Testing {label} ---")
     
     try:
         # Get the provider
         provider = get_provider(config)
         
         # Initialize the provider
-        print("Initializing provider...")
-        await provider.initialize()
+        print(f"[{label}] Initializing provider...")
+        await run_provider_call(config, provider.initialize())
         
         # Generate a response
-        print("Generating response...")
-        response = await provider.generate_response(messages)
+        print(f"[{label}] Generating response...")
+        response = await run_provider_call(config, provider.generate_response(messages))
         
-        print("\nResponse:")
+        print(f"\n[{label}] Response:")
         print(f"{response}")
         
-        print("\nTest completed successfully.")
+        print(f"\n[{label}] Test completed successfully.")
         
     except Exception as e:
-        print(f"\nError testing provider: {str(e)}")
+        print(f"\n[{label}] Error testing provider: {str(e)}")
 
 
 async def main():
@@ -54,38 +70,43 @@ async def main():
     
     # Test providers based on environment variables
     # HuggingFace (always test)
-    huggingface_config = ModelConfig(
-        provider=ModelProviderType.HUGGINGFACE,
-        model_id="gpt2",  # Small model for quick testing
-        device="cpu",
-        optimize=False
-    )
-    await test_provider(huggingface_config, messages)
+    configs = [
+        ModelConfig(
+            provider=ModelProviderType.HUGGINGFACE,
+            model_id="gpt2",  # Small model for quick testing
+            device="cpu",
+            optimize=False
+        )
+    ]
     
     # OpenAI (test if API key is available)
     openai_api_key = os.environ.get("OPENAI_API_KEY")
     if openai_api_key:
-        openai_config = ModelConfig(
+        configs.append(ModelConfig(
             provider=ModelProviderType.OPENAI,
             model_id="gpt-3.5-turbo",
             api_key=openai_api_key
-        )
-        await test_provider(openai_config, messages)
+        ))
     else:
         print("\n--- Skipping OpenAI test (no API key) ---")
     
     # Anthropic (test if API key is available)
     anthropic_api_key = os.environ.get("ANTHROPIC_API_KEY")
     if anthropic_api_key:
-        anthropic_config = ModelConfig(
+        configs.append(ModelConfig(
             provider=ModelProviderType.ANTHROPIC,
             model_id="claude-3-haiku-20240307",
             api_key=anthropic_api_key
-        )
-        await test_provider(anthropic_config, messages)
+        ))
     else:
         print("\n--- Skipping Anthropic test (no API key) ---")
+    
+    # The providers are independent, so test them concurrently
+    await asyncio.gather(
+        *(test_provider(config, messages) for config in configs),
+        return_exceptions=True,
+    )
 
 
 if __name__ == "__main__":
-    asyncio.run(main())
+    run(main())
@@ -10,13 +10,18 @@ This script demonstrates how to:
 
 import argparse
 import asyncio
-import json
+import base64
+import binascii
 import logging
 import sys
+import time
 from pathlib import Path
 from typing import Dict, Optional, Any
 
 import httpx
+import orjson
+
+from scripts import run
 
 # Configure logging
 logging.basicConfig(
@@ -26,6 +31,25 @@ logging.basicConfig(
 logger = logging.getLogger(__name__)
 
 
+def _jwt_lifetime(token: str) -> Optional[int]:
+    """Read the remaining lifetime of a JWT from its ``exp`` claim.
+    
+    The signature is not verified; the claim is only used to schedule refreshes.
+    
+    Args:
+        token: Encoded JWT
+    
+    Returns:
+        Seconds until the token expires, or None if it carries no ``exp`` claim
+    """
+    try:
+        payload = token.split(".")[1]
+        claims = orjson.loads(base64.urlsafe_b64decode(payload + "=" * (-len(payload) % 4)))
+        return int(claims["exp"] - time.time())
+    except (IndexError, KeyError, TypeError, ValueError, binascii.Error):
+        return None
+
+
 class SchedulerClient:
     """Client for interacting with the Scheduler MCP service."""
     
@@ -42,6 +66,30 @@ class SchedulerClient:
         self.api_key = api_key
         self.token = None
         self.token_expires_at = None
+        self._token_acquired_at: float = 0.0
+        self._auth_payload = {"clientId": client_id, "apiKey": api_key}
+        self._auth_headers: Dict[str, str] = {}
+        self._auth_lock = asyncio.Lock()
+        self._client = httpx.AsyncClient(
+            base_url=self.base_url,
+            http2=True,
+            timeout=httpx.Timeout(10.0),
+            limits=httpx.Limits(
+                max_keepalive_connections=20,
+                max_connections=100,
+                keepalive_expiry=15.0,
+            ),
+        )
+    
+    async def __aenter__(self) -> "SchedulerClient":
+        return self
+    
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+    
+    async def aclose(self) -> None:
+        """Close the underlying HTTP connection pool."""
+        await self._client.aclose()
     
     async def authenticate(self) -> bool:
         """Authenticate with the Scheduler service.
@@ -49,30 +97,68 @@ class SchedulerClient:
         Returns:
             True if authentication was successful, False otherwise
         """
-        auth_url = f"{self.base_url}/api/auth/token"
-        payload = {
-            "clientId": self.client_id,
-            "apiKey": self.api_key
-        }
-        
         try:
-            logger.info(f"Authenticating with {auth_url}")
-            async with httpx.AsyncClient() as client:
-                response = await client.post(auth_url, json=payload)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    self.token = data["token"]
-                    self.token_expires_at = data.get("expiresIn")  # in seconds
-                    logger.info(f"Authentication successful, token expires in {self.token_expires_at} seconds")
-                    return True
-                else:
-                    logger.error(f"Authentication failed: {response.status_code} - {response.text}")
-                    return False
+            logger.info("Authenticating with %s/api/auth/token", self.base_url)
+            response = await self._client.post("/api/auth/token", json=self._auth_payload)
+            
+            if response.status_code == 200:
+                data = response.json()
+                self.token = data["token"]
+                self._auth_headers = {
+                    "Authorization": f"Bearer {self.token}",
+                    "Content-Type": "application/json"
+                }
+                # Lifetime in seconds; None if neither the response nor the
+                # token's exp claim says, in which case the token is kept
+                expires_in = data.get("expiresIn")
+                self.token_expires_at = (
+                    int(expires_in) if expires_in is not None else _jwt_lifetime(self.token)
+                )
+                self._token_acquired_at = time.monotonic()
+                logger.info("Authentication successful, token expires in %s seconds", self.token_expires_at)
+                return True
+            else:
+                logger.error("Authentication failed: %s - %s", response.status_code, response.text)
+                return False
         
         except Exception as e:
-            logger.error(f"Error during authentication: {e}", exc_info=True)
+            logger.error("Error during authentication: %s", e, exc_info=True)
+            return False
+    
+    def _token_is_fresh(self, skew: float) -> bool:
+        """Check whether the cached token is still valid.
+        
+        Args:
+            skew: Seconds before the real expiry at which the token is treated as
+                expired, capped at half the token's lifetime
+        
+        Returns:
+            True if a token is cached and has not (nearly) expired
+        """
+        if not self.token:
             return False
+        if self.token_expires_at is None:
+            return True
+        skew = min(skew, self.token_expires_at / 2)
+        return time.monotonic() - self._token_acquired_at < self.token_expires_at - skew
+    
+    async def ensure_token(self, skew: float = 30.0) -> bool:
+        """Authenticate only if there is no cached token or it is about to expire.
+        
+        Args:
+            skew: Seconds before the real expiry at which the token is refreshed
+        
+        Returns:
+            True if a valid token is available, False otherwise
+        """
+        if self._token_is_fresh(skew):
+            return True
+        
+        # Only one coroutine refreshes; the others wait and reuse its token
+        async with self._auth_lock:
+            if self._token_is_fresh(skew):
+                return True
+            return await self.authenticate()
     
     async def get_mcp_tools(self) -> Optional[Dict[str, Any]]:
         """Get MCP tools from the service.
@@ -80,27 +166,22 @@ class SchedulerClient:
         Returns:
             Dictionary of MCP tools or None if failed
         """
-        if not self.token:
-            logger.error("Not authenticated, call authenticate() first")
+        if not await self.ensure_token():
             return None
         
-        tools_url = f"{self.base_url}/mcp/tools"
-        headers = {"Authorization": f"Bearer {self.token}"}
-        
         try:
-            logger.info(f"Getting MCP tools from {tools_url}")
-            async with httpx.AsyncClient() as client:
-                response = await client.get(tools_url, headers=headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data
-                else:
-                    logger.error(f"Failed to get tools: {response.status_code} - {response.text}")
-                    return None
+            logger.info("Getting MCP tools from %s/mcp/tools", self.base_url)
+            response = await self._client.get("/mcp/tools", headers=self._auth_headers)
+            
+            if response.status_code == 200:
+                data = response.json()
+                return data
+            else:
+                logger.error("Failed to get tools: %s - %s", response.status_code, response.text)
+                return None
         
         except Exception as e:
-            logger.error(f"Error getting MCP tools: {e}", exc_info=True)
+            logger.error("Error getting MCP tools: %s", e, exc_info=True)
             return None
     
     async def execute_tool(self, tool_id: str, parameters: Dict[str, Any]) -> Optional[Dict[str, Any]]:
@@ -113,34 +194,27 @@ class SchedulerClient:
         Returns:
             Tool execution result or None if failed
         """
-        if not self.token:
-            logger.error("Not authenticated, call authenticate() first")
+        if not await self.ensure_token():
             return None
         
-        execute_url = f"{self.base_url}/mcp/execute"
-        headers = {
-            "Authorization": f"Bearer {self.token}",
-            "Content-Type": "application/json"
-        }
         payload = {
             "toolId": tool_id,
             "toolParameters": parameters
         }
         
         try:
-            logger.info(f"Executing tool {tool_id} with parameters {parameters}")
-            async with httpx.AsyncClient() as client:
-                response = await client.post(execute_url, json=payload, headers=headers)
-                
-                if response.status_code == 200:
-                    data = response.json()
-                    return data
-                else:
-                    logger.error(f"Tool execution failed: {response.status_code} - {response.text}")
-                    return None
+            logger.info("Executing tool %s with parameters %s", tool_id, parameters)
+            response = await self._client.post("/mcp/execute", json=payload, headers=self._auth_headers)
+            
+            if response.status_code == 200:
+                data = response.json()
+                return data
+            else:
+                logger.error("Tool execution failed: %s - %s", response.status_code, response.text)
+                return None
         
         except Exception as e:
-            logger.error(f"Error executing tool: {e}", exc_info=True)
+            logger.error("Error executing tool: %s", e, exc_info=True)
             return None
 
 
@@ -156,49 +230,50 @@ async def test_scheduler_auth(
         test_schedule: Whether to test scheduling a conversation
     """
     # Create and authenticate the client
-    client = SchedulerClient(base_url, client_id, api_key)
-    if not await client.authenticate():
-        logger.error("Authentication failed, exiting")
-        return
-    
-    # Get MCP tools
-    tools = await client.get_mcp_tools()
-    if not tools:
-        logger.error("Failed to get MCP tools, exiting")
-        return
-    
-    logger.info(f"MCP tools: {json.dumps(tools, indent=2)}")
-    
-    # Test scheduling a conversation if requested
-    if test_schedule:
-        # Schedule a simple test conversation
-        schedule_params = {
-            "conversationText": "This is a test scheduled message from the RussellDemo integration",
-            "scheduledTime": "2025-05-28T12:00:00Z",  # Tomorrow
-            "endpoint": "https://example.com/callback",
-            "method": "POST",
-            "additionalInfo": "Test from RussellDemo MCP SDK integration"
-        }
+    async with SchedulerClient(base_url, client_id, api_key) as client:
+        if not await client.authenticate():
+            logger.error("Authentication failed, exiting")
+            return
         
-        result = await client.execute_tool("scheduleConversation", schedule_params)
-        if result:
-            conversation_id = result.get("toolResult")
-            logger.info(f"Scheduled conversation with ID: {conversation_id}")
+        # Get MCP tools
+        tools = await client.get_mcp_tools()
+        if not tools:
+            logger.error("Failed to get MCP tools, exiting")
+            return
+        
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("MCP tools: %s", orjson.dumps(tools, option=orjson.OPT_INDENT_2).decode())
+        
+        # Test scheduling a conversation if requested
+        if test_schedule:
+            # Schedule a simple test conversation
+            schedule_params = {
+                "conversationText": "This is a test scheduled message from the RussellDemo integration",
+                "scheduledTime": "2025-05-28T12:00:00Z",  # Tomorrow
+                "endpoint": "https://example.com/callback",
+                "method": "POST",
+                "additionalInfo": "Test from RussellDemo MCP SDK integration"
+            }
             
-            # Check conversation status
-            if conversation_id:
-                status_result = await client.execute_tool(
-                    "getConversationStatus", 
-                    {"conversationId": conversation_id}
-                )
+            result = await client.execute_tool("scheduleConversation", schedule_params)
+            if result:
+                conversation_id = result.get("toolResult")
+                logger.info("Scheduled conversation with ID: %s", conversation_id)
                 
-                if status_result:
-                    status = status_result.get("toolResult")
-                    logger.info(f"Conversation status: {status}")
-                else:
-                    logger.error("Failed to get conversation status")
-        else:
-            logger.error("Failed to schedule conversation")
+                # Check conversation status
+                if conversation_id:
+                    status_result = await client.execute_tool(
+                        "getConversationStatus", 
+                        {"conversationId": conversation_id}
+                    )
+                    
+                    if status_result:
+                        status = status_result.get("toolResult")
+                        logger.info("Conversation status: %s", status)
+                    else:
+                        logger.error("Failed to get conversation status")
+            else:
+                logger.error("Failed to schedule conversation")
 
 
 def main() -> int:
@@ -212,10 +287,10 @@ def main() -> int:
     args = parser.parse_args()
     
     try:
-        asyncio.run(test_scheduler_auth(args.url, args.client_id, args.api_key, args.test_schedule))
+        run(test_scheduler_auth(args.url, args.client_id, args.api_key, args.test_schedule))
         return 0
     except Exception as e:
-        logger.error(f"Error: {e}", exc_info=True)
+        logger.error("Error: %s", e, exc_info=True)
         return 1
 
 
@@ -15,8 +15,8 @@ import asyncio
 import json
 import logging
 import os
+import random
 import signal
-import subprocess
 import sys
 import time
 from datetime import datetime, timedelta
@@ -26,9 +26,8 @@ from urllib.parse import urljoin
 
 import httpx
 
-sys.path.append(str(Path(__file__).parent.parent))
-
 from app.scheduler.scheduler_service import SchedulerService
+from scripts import run
 
 # Configure logging
 logging.basicConfig(
@@ -48,40 +47,82 @@ DEFAULT_SCHEDULER_PORT = 5146
 DEFAULT_SCHEDULER_URL = f"http://{DEFAULT_SCHEDULER_HOST}:{DEFAULT_SCHEDULER_PORT}"
 
 
-async def wait_for_server(url: str, timeout: int = 60, interval: int = 1) -> bool:
+async def wait_for_server(
+    url: str,
+    timeout: int = 60,
+    interval: int = 1,
+    process: Optional[asyncio.subprocess.Process] = None
+) -> bool:
     """Wait for a server to become available.
     
+    Checks start 100ms apart and back off exponentially, with a little
+    jitter, up to the given interval.
+    
     Args:
         url: Server URL to check
         timeout: Timeout in seconds
-        interval: Check interval in seconds
+        interval: Maximum check interval in seconds
+        process: Process running the server; stop waiting if it exits
     
     Returns:
         True if server is available, False otherwise
     """
-    start_time = time.time()
+    deadline = time.monotonic() + timeout
+    delay = 0.1
     logger.info(f"Waiting for server at {url} to become available...")
     
-    while time.time() - start_time < timeout:
-        try:
-            async with httpx.AsyncClient() as client:
-                response = await client.get(f"{url}/health", timeout=5)
+    # A server that is still starting refuses connections, so fail fast on connect
+    probe_timeout = httpx.Timeout(connect=2.0, read=3.0, write=3.0, pool=3.0)
+    async with httpx.AsyncClient(timeout=probe_timeout) as client:
+        while time.monotonic() < deadline:
+            try:
+                response = await client.get(f"{url}/health")
                 if response.status_code == 200:
                     logger.info(f"Server at {url} is available")
                     return True
-        except Exception:
-            pass
-        
-        await asyncio.sleep(interval)
+            except Exception:
+                pass
+            
+            if process is not None and process.returncode is not None:
+                logger.error(f"Server process for {url} exited with code {process.returncode}")
+                return False
+            
+            await asyncio.sleep(delay + random.uniform(0, delay * 0.1))
+            delay = min(delay * 2, interval)
     
     logger.error(f"Timeout waiting for server at {url}")
     return False
 
 
+async def stop_process(
+    process: Optional[asyncio.subprocess.Process],
+    name: str,
+    timeout: float = 5.0
+) -> None:
+    """Terminate a server process, killing it if it does not exit in time.
+    
+    Args:
+        process: Process to stop; None is ignored
+        name: Server name for logging
+        timeout: Seconds to wait after SIGTERM before sending SIGKILL
+    """
+    if process is None or process.returncode is not None:
+        return
+    
+    logger.info(f"Stopping {name}")
+    process.terminate()
+    try:
+        await asyncio.wait_for(process.wait(), timeout=timeout)
+    except asyncio.TimeoutError:
+        logger.warning(f"{name} did not exit after {timeout}s, killing it")
+        process.kill()
+        await process.wait()
+
+
 async def start_api_server(
     host: str = DEFAULT_API_HOST, 
     port: int = DEFAULT_API_PORT
-) -> Optional[subprocess.Popen]:
+) -> Optional[asyncio.subprocess.Process]:
     """Start the API server as a subprocess.
     
     Args:
@@ -94,18 +135,16 @@ async def start_api_server(
     logger.info(f"Starting API server on {host}:{port}")
     
     try:
-        # Start the API server using uvicorn
-        process = subprocess.Popen(
-            [
-                "uvicorn", 
-                "app.main:app", 
-                "--host", host, 
-                "--port", str(port),
-                "--log-level", "info"
-            ],
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True,
+        # Start the API server using uvicorn. Its output is discarded rather
+        # than piped, since an undrained pipe blocks the server once it fills.
+        process = await asyncio.create_subprocess_exec(
+            "uvicorn", 
+            "app.main:app", 
+            "--host", host, 
+            "--port", str(port),
+            "--log-level", "info",
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL,
             cwd=str(Path(__file__).parent.parent)
         )
         
@@ -113,12 +152,11 @@ async def start_api_server(
         
         # Wait for the server to become available
         server_url = f"http://{host}:{port}"
-        if await wait_for_server(server_url):
+        if await wait_for_server(server_url, process=process):
             return process
         else:
             # Kill the process if the server doesn't become available
-            process.terminate()
-            process.wait(timeout=5)
+            await stop_process(process, "API server")
             return None
     
     except Exception as e:
@@ -130,7 +168,7 @@ async def start_scheduler_service(
     host: str = DEFAULT_SCHEDULER_HOST, 
     port: int = DEFAULT_SCHEDULER_PORT,
     scheduler_path: Optional[str] = None
-) -> Optional[subprocess.Popen]:
+) -> Optional[asyncio.subprocess.Process]:
     """Start the Scheduler service as a subprocess.
     
     Args:
@@ -166,23 +204,21 @@ async def start_scheduler_service(
             command.extend(["--path", scheduler_path])
         
         # Start the Scheduler service
-        process = subprocess.Popen(
-            command,
-            stdout=subprocess.PIPE,
-            stderr=subprocess.STDOUT,
-            text=True
+        process = await asyncio.create_subprocess_exec(
+            *command,
+            stdout=asyncio.subprocess.DEVNULL,
+            stderr=asyncio.subprocess.DEVNULL
         )
         
         logger.info(f"Scheduler service started with PID {process.pid}")
         
         # Wait for the Scheduler service to become available
         server_url = f"http://{host}:{port}"
-        if await wait_for_server(server_url, timeout=30):
+        if await wait_for_server(server_url, timeout=30, process=process):
             return process
         else:
             # Kill the process if the service doesn't become available
-            process.terminate()
-            process.wait(timeout=5)
+            await stop_process(process, "Scheduler service")
             return None
     
     except Exception as e:
@@ -190,6 +226,40 @@ async def start_scheduler_service(
         return None
 
 
+async def _wait_for_status(
+    scheduler: SchedulerService,
+    conversation_id: str,
+    expected: str,
+    deadline_s: float = 10.0
+) -> Optional[str]:
+    """Poll a conversation's status until it matches or the deadline passes.
+    
+    Polls start 50ms apart and back off exponentially up to one second, since
+    the Scheduler may not have committed a change when the call returns.
+    
+    Args:
+        scheduler: Initialized Scheduler service wrapper
+        conversation_id: ID of the conversation to check
+        expected: Expected status, compared case-insensitively
+        deadline_s: Maximum time to wait in seconds
+    
+    Returns:
+        The last status seen, or None if it could never be retrieved
+    """
+    start = time.monotonic()
+    delay = 0.05
+    status = None
+    
+    while True:
+        status = await scheduler.get_conversation_status(conversation_id) or status
+        if status and status.lower() == expected:
+            return status
+        if time.monotonic() - start + delay >= deadline_s:
+            return status
+        await asyncio.sleep(delay)
+        delay = min(delay * 2, 1.0)
+
+
 async def test_scheduler_integration(
     api_url: str = DEFAULT_API_URL,
     scheduler_url: str = DEFAULT_SCHEDULER_URL
@@ -231,7 +301,7 @@ async def test_scheduler_integration(
         logger.info(f"Scheduled conversation with ID: {conversation_id}")
         
         # Check the conversation status
-        status = await scheduler.get_conversation_status(conversation_id)
+        status = await _wait_for_status(scheduler, conversation_id, "scheduled")
         if not status:
             logger.error("Failed to get conversation status")
             return False
@@ -253,7 +323,7 @@ async def test_scheduler_integration(
         logger.info(f"Successfully cancelled conversation {conversation_id}")
         
         # Check the status again to verify cancellation
-        status = await scheduler.get_conversation_status(conversation_id)
+        status = await _wait_for_status(scheduler, conversation_id, "cancelled")
         if not status:
             logger.error("Failed to get conversation status after cancellation")
             return False
@@ -304,16 +374,14 @@ async def run_integration_test(
     try:
         # Start the servers if requested
         if start_servers:
-            # Start the API server
-            api_process = await start_api_server(api_host, api_port)
+            # Start both servers at once so their startup waits overlap
+            api_process, scheduler_process = await asyncio.gather(
+                start_api_server(api_host, api_port),
+                start_scheduler_service(scheduler_host, scheduler_port, scheduler_path)
+            )
             if not api_process:
                 logger.error("Failed to start API server")
                 return False
-            
-            # Start the Scheduler service
-            scheduler_process = await start_scheduler_service(
-                scheduler_host, scheduler_port, scheduler_path
-            )
             if not scheduler_process:
                 logger.error("Failed to start Scheduler service")
                 return False
@@ -326,15 +394,10 @@ async def run_integration_test(
     
     finally:
         # Clean up
-        if api_process:
-            logger.info("Stopping API server")
-            api_process.terminate()
-            api_process.wait(timeout=5)
-        
-        if scheduler_process:
-            logger.info("Stopping Scheduler service")
-            scheduler_process.terminate()
-            scheduler_process.wait(timeout=5)
+        await asyncio.gather(
+            stop_process(api_process, "API server"),
+            stop_process(scheduler_process, "Scheduler service")
+        )
 
 
 def main() -> int:
@@ -378,7 +441,7 @@ def main() -> int:
     args = parser.parse_args()
     
     try:
-        success = asyncio.run(run_integration_test(
+        success = run(run_integration_test(
             start_servers=not args.no_start_servers,
             api_host=args.api_host,
             api_port=args.api_port,
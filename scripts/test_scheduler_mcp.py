@@ -14,6 +14,8 @@ from pathlib import Path
 
 from mcp import Client
 
+from scripts import run
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -40,9 +42,12 @@ async def test_scheduler_connection(url: str) -> None:
             await client.initialize()
             logger.info("Client initialized")
             
-            # List available tools
-            logger.info("Listing tools...")
-            tools = await client.list_tools()
+            # List available tools and resources concurrently
+            logger.info("Listing tools and resources...")
+            tools, resources = await asyncio.gather(
+                client.list_tools(), client.list_resources()
+            )
+            
             logger.info(f"Found {len(tools)} tools:")
             for tool in tools:
                 logger.info(f"  - {tool.name}: {tool.description}")
@@ -52,9 +57,6 @@ async def test_scheduler_connection(url: str) -> None:
                         required = "required" if param.required else "optional"
                         logger.info(f"      - {param.name}: {param.description} ({required})")
             
-            # List available resources
-            logger.info("Listing resources...")
-            resources = await client.list_resources()
             logger.info(f"Found {len(resources)} resources:")
             for resource in resources:
                 logger.info(f"  - {resource.name}: {resource.description}")
@@ -76,7 +78,7 @@ def main() -> int:
     args = parser.parse_args()
     
     try:
-        asyncio.run(test_scheduler_connection(args.url))
+        run(test_scheduler_connection(args.url))
         return 0
     except Exception as e:
         logger.error(f"Error: {e}", exc_info=True)
@@ -5,12 +5,13 @@ Script to update the Scheduler service configuration in config.json.
 This script ensures the Scheduler service is properly configured to use the HTTP transport type.
 """
 
-import json
 import logging
 import os
 import sys
 from pathlib import Path
 
+import orjson
+
 # Configure logging
 logging.basicConfig(
     level=logging.INFO,
@@ -27,8 +28,7 @@ def update_scheduler_config() -> None:
     
     try:
         # Load the current configuration
-        with open(CONFIG_FILE, "r") as f:
-            config = json.load(f)
+        config = orjson.loads(CONFIG_FILE.read_bytes())
         
         # Check if mcp section exists
         if "mcp" not in config:
@@ -42,44 +42,40 @@ def update_scheduler_config() -> None:
         client_id = os.environ.get("SCHEDULER_CLIENT_ID", "default_client_id")
         api_key = os.environ.get("SCHEDULER_API_KEY", "default_api_key")
         
-        # Look for Scheduler configuration
-        scheduler_found = False
-        for i, server in enumerate(config["mcp"]["mcp_servers"]):
-            if server.get("name") == "Scheduler":
-                scheduler_found = True
-                # Update Scheduler configuration
-                logger.info("Updating existing Scheduler configuration")
-                config["mcp"]["mcp_servers"][i] = {
-                    "name": "Scheduler",
-                    "transport": {
-                        "type": "http",
-                        "url": "http://localhost:5146/mcp",
-                        "auth": {
-                            "client_id": client_id,
-                            "api_key": api_key
-                        }
-                    }
+        scheduler_entry = {
+            "name": "Scheduler",
+            "transport": {
+                "type": "http",
+                "url": "http://localhost:5146/mcp",
+                "auth": {
+                    "client_id": client_id,
+                    "api_key": api_key
                 }
-                break
+            }
+        }
         
-        # Add Scheduler configuration if not found
-        if not scheduler_found:
+        # Look for Scheduler configuration
+        servers = config["mcp"]["mcp_servers"]
+        index = next(
+            (i for i, server in enumerate(servers) if server.get("name") == "Scheduler"),
+            None,
+        )
+        
+        if index is not None:
+            # Leave the file (and its mtime) alone if nothing would change
+            if servers[index] == scheduler_entry:
+                logger.info(f"Scheduler configuration in {CONFIG_FILE} is already up to date")
+                return
+            # Update Scheduler configuration
+            logger.info("Updating existing Scheduler configuration")
+            servers[index] = scheduler_entry
+        else:
+            # Add Scheduler configuration if not found
             logger.info("Adding new Scheduler configuration")
-            config["mcp"]["mcp_servers"].append({
-                "name": "Scheduler",
-                "transport": {
-                    "type": "http",
-                    "url": "http://localhost:5146/mcp",
-                    "auth": {
-                        "client_id": client_id,
-                        "api_key": api_key
-                    }
-                }
-            })
+            servers.append(scheduler_entry)
         
         # Save the updated configuration
-        with open(CONFIG_FILE, "w") as f:
-            json.dump(config, f, indent=2)
+        CONFIG_FILE.write_bytes(orjson.dumps(config, option=orjson.OPT_INDENT_2))
         
         logger.info(f"Scheduler configuration updated successfully in {CONFIG_FILE}")
     
@@ -9,31 +9,167 @@ Usage:
     python webscraper_server.py
 """
 
-import json
+import asyncio
+import functools
+import itertools
 import logging
+import os
+import re
 import sys
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, BinaryIO, Dict, List, Optional, Tuple
 
 import httpx
+import orjson
+
+try:
+    # The Lexbor backend is the one selectolax 1.x still ships
+    from selectolax.lexbor import LexborHTMLParser as HTMLParser
+except ImportError:
+    HTMLParser = None
+
+try:
+    import lxml.html as lxml_html
+except ImportError:
+    lxml_html = None
 
-# Setup logging
-logging.basicConfig(
-    level=logging.INFO,
-    format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-    filename="webscraper_server.log",
-)
 logger = logging.getLogger("webscraper_server")
 
+# Pages larger than this are truncated rather than buffered in full
+MAX_PAGE_BYTES = 8 * 1024 * 1024
+
+# Pages kept for revalidation with If-None-Match/If-Modified-Since, bounded
+# both by count and by the total size of their bodies
+MAX_CACHED_PAGES = 256
+MAX_CACHE_BYTES = 64 * 1024 * 1024
+
+
+class _StaticResponse(dict):
+    """A constant response that carries its own pre-encoded JSON."""
+    
+    __slots__ = ("encoded",)
+    
+    def __init__(self, **fields: Any):
+        """Initialize the response and encode it once.
+        
+        Args:
+            **fields: Response fields
+        """
+        super().__init__(fields)
+        self.encoded = orjson.dumps(self)
+
+
+_ERR_URL_REQUIRED = _StaticResponse(error="URL is required")
+_ERR_HTML_REQUIRED = _StaticResponse(error="HTML content is required")
+_ERR_SELECTOR_REQUIRED = _StaticResponse(error="CSS selector is required")
+_ERR_QUERY_REQUIRED = _StaticResponse(error="Search query is required")
+_ERR_REQUEST_TOO_LARGE = _StaticResponse(error="Request too large")
+_ERR_NO_HTML_PARSER = _StaticResponse(
+    error="Install selectolax or lxml for CSS selectors other than 'title'"
+)
+
+_TITLE_RE = re.compile(r"<title>(.*?)</title>", re.IGNORECASE | re.DOTALL)
+
+
+def _find_title(html: str) -> Optional[str]:
+    """Return the page title, or None if the page has none.
+    
+    Lowercase ``<title>`` tags are located with ``str.find``; other spellings
+    fall back to a case-insensitive regex.
+    
+    Args:
+        html: HTML content
+        
+    Returns:
+        Title text with surrounding whitespace removed
+    """
+    start = html.find("<title>")
+    if start != -1:
+        start += len("<title>")
+        end = html.find("</title>", start)
+        if end != -1:
+            return html[start:end].strip()
+    
+    match = _TITLE_RE.search(html)
+    return match.group(1).strip() if match else None
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_query(query: str) -> "re.Pattern[str]":
+    """Compile a case-insensitive literal search pattern, cached per query."""
+    return re.compile(re.escape(query), re.IGNORECASE)
+
+
+def _css_select(html: str, selector: str) -> Optional[List[str]]:
+    """Return the text of every element matching a CSS selector.
+    
+    Uses selectolax when installed, falling back to lxml (with cssselect).
+    
+    Args:
+        html: HTML content
+        selector: CSS selector
+        
+    Returns:
+        Text of the matching elements, or None if no HTML parser is available
+    """
+    if HTMLParser is not None:
+        # Strip the joined text, like lxml's text_content(), rather than each
+        # text node, which would glue "Hello <b>world</b>" into "Helloworld"
+        return [node.text().strip() for node in HTMLParser(html).css(selector)]
+    if lxml_html is not None:
+        return [
+            element.text_content().strip()
+            for element in lxml_html.fromstring(html).cssselect(selector)
+        ]
+    return None
+
 
 class WebScraperServer:
     """MCP server for web scraping capabilities."""
 
-    def __init__(self):
-        """Initialize the server."""
-        self.client = httpx.Client(timeout=30.0)
+    # Dispatch tables, looked up by request type and resource/tool name
+    _REQUEST_HANDLERS = {
+        "resource": lambda self, name, params: self._handle_resource(name, params),
+        "tool": lambda self, name, params: self._handle_tool(name, params),
+    }
+    _RESOURCE_HANDLERS = {
+        "webpage": lambda self, params: self._get_webpage(params.get("url")),
+    }
+    _TOOL_HANDLERS = {
+        "extract_text": lambda self, params: self._extract_text(
+            params.get("html"), params.get("selector")
+        ),
+        "search_text": lambda self, params: self._search_text(
+            params.get("html"), params.get("query")
+        ),
+    }
+
+    def __init__(self, max_page_bytes: int = MAX_PAGE_BYTES):
+        """Initialize the server.
+        
+        Args:
+            max_page_bytes: Maximum number of body bytes kept per fetched page
+        """
+        self.max_page_bytes = max_page_bytes
+        self._page_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._page_cache_bytes = 0
+        self.client = httpx.AsyncClient(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=100,
+                max_keepalive_connections=20,
+                keepalive_expiry=30.0,
+            ),
+            timeout=httpx.Timeout(connect=5.0, read=30.0, write=30.0, pool=5.0),
+            headers={"User-Agent": "MCP-WebScraper/1.0"},
+        )
         logger.info("WebScraper server initialized")
 
-    def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
+    async def aclose(self) -> None:
+        """Close the HTTP client and its keep-alive connections."""
+        await self.client.aclose()
+
+    async def handle_request(self, request: Dict[str, Any]) -> Dict[str, Any]:
         """Handle an MCP request.
         
         Args:
@@ -46,17 +182,16 @@ class WebScraperServer:
         name = request.get("name")
         params = request.get("params", {})
         
-        logger.info(f"Received {request_type} request for {name}")
+        logger.info("Received %s request for %s", request_type, name)
         
-        if request_type == "resource":
-            return self._handle_resource(name, params)
-        elif request_type == "tool":
-            return self._handle_tool(name, params)
-        else:
-            logger.warning(f"Unsupported request type: {request_type}")
+        handler = self._REQUEST_HANDLERS.get(request_type)
+        if handler is None:
+            logger.warning("Unsupported request type: %s", request_type)
             return {"error": f"Unsupported request type: {request_type}"}
+        
+        return await handler(self, name, params)
     
-    def _handle_resource(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_resource(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a resource request.
         
         Args:
@@ -66,15 +201,17 @@ class WebScraperServer:
         Returns:
             Resource data
         """
-        if name == "webpage":
-            return self._get_webpage(params.get("url"))
-        elif name == "available_resources":
-            return {"resources": ["webpage"]}
-        else:
-            logger.warning(f"Unknown resource: {name}")
+        if name == "available_resources":
+            return {"resources": list(self._RESOURCE_HANDLERS)}
+        
+        handler = self._RESOURCE_HANDLERS.get(name)
+        if handler is None:
+            logger.warning("Unknown resource: %s", name)
             return {"error": f"Unknown resource: {name}"}
+        
+        return await handler(self, params)
     
-    def _handle_tool(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
+    async def _handle_tool(self, name: str, params: Dict[str, Any]) -> Dict[str, Any]:
         """Handle a tool request.
         
         Args:
@@ -84,19 +221,17 @@ class WebScraperServer:
         Returns:
             Tool result
         """
-        if name == "extract_text":
-            return self._extract_text(params.get("html"), params.get("selector"))
-        elif name == "search_text":
-            return self._search_text(
-                params.get("html"), params.get("query")
-            )
-        elif name == "available_tools":
-            return {"tools": ["extract_text", "search_text"]}
-        else:
-            logger.warning(f"Unknown tool: {name}")
+        if name == "available_tools":
+            return {"tools": list(self._TOOL_HANDLERS)}
+        
+        handler = self._TOOL_HANDLERS.get(name)
+        if handler is None:
+            logger.warning("Unknown tool: %s", name)
             return {"error": f"Unknown tool: {name}"}
+        
+        return handler(self, params)
     
-    def _get_webpage(self, url: Optional[str]) -> Dict[str, Any]:
+    async def _get_webpage(self, url: Optional[str]) -> Dict[str, Any]:
         """Get a webpage.
         
         Args:
@@ -106,26 +241,87 @@ class WebScraperServer:
             Webpage content
         """
         if not url:
-            return {"error": "URL is required"}
+            return _ERR_URL_REQUIRED
         
         try:
-            logger.info(f"Fetching webpage: {url}")
-            response = self.client.get(
-                url,
-                headers={"User-Agent": "MCP-WebScraper/1.0"},
-            )
-            response.raise_for_status()
+            logger.info("Fetching webpage: %s", url)
             
-            return {
+            # Revalidate a cached copy instead of downloading it again
+            cached = self._page_cache.get(url)
+            headers = {}
+            if cached:
+                if cached["etag"]:
+                    headers["If-None-Match"] = cached["etag"]
+                if cached["last_modified"]:
+                    headers["If-Modified-Since"] = cached["last_modified"]
+            
+            async with self.client.stream("GET", url, headers=headers) as response:
+                if cached and response.status_code == 304:
+                    logger.info("Webpage not modified: %s", url)
+                    self._page_cache.move_to_end(url)
+                    return dict(cached["page"])
+                
+                response.raise_for_status()
+                
+                # Stream the body so oversized pages are cut off at the limit
+                # instead of being buffered whole
+                body = bytearray()
+                truncated = False
+                async for chunk in response.aiter_bytes():
+                    remaining = self.max_page_bytes - len(body)
+                    if len(chunk) > remaining:
+                        body += chunk[:remaining]
+                        truncated = True
+                        break
+                    body += chunk
+            
+            if truncated:
+                logger.warning("Truncated %s to %d bytes", url, self.max_page_bytes)
+            
+            # Decode once with the declared charset; httpx falls back to UTF-8
+            # rather than running charset detection over the body
+            encoding = response.encoding or "utf-8"
+            page = {
                 "url": url,
                 "status_code": response.status_code,
                 "content_type": response.headers.get("Content-Type", ""),
-                "html": response.text,
+                "encoding": encoding,
+                "html": body.decode(encoding, errors="replace"),
+                "truncated": truncated,
             }
+            
+            etag = response.headers.get("ETag")
+            last_modified = response.headers.get("Last-Modified")
+            self._uncache_page(url)
+            if (etag or last_modified) and not truncated and len(body) <= MAX_CACHE_BYTES:
+                self._page_cache[url] = {
+                    "etag": etag,
+                    "last_modified": last_modified,
+                    "page": page,
+                    "size": len(body),
+                }
+                self._page_cache_bytes += len(body)
+                while (
+                    len(self._page_cache) > MAX_CACHED_PAGES
+                    or self._page_cache_bytes > MAX_CACHE_BYTES
+                ):
+                    self._uncache_page(next(iter(self._page_cache)))
+            
+            return dict(page)
         except Exception as e:
-            logger.exception(f"Error fetching webpage {url}: {e}")
+            logger.exception("Error fetching webpage %s: %s", url, e)
             return {"error": str(e)}
     
+    def _uncache_page(self, url: str) -> None:
+        """Drop a page from the revalidation cache, if present.
+        
+        Args:
+            url: URL of the page
+        """
+        entry = self._page_cache.pop(url, None)
+        if entry is not None:
+            self._page_cache_bytes -= entry["size"]
+    
     def _extract_text(
         self, html: Optional[str], selector: Optional[str]
     ) -> Dict[str, Any]:
@@ -136,27 +332,27 @@ class WebScraperServer:
             selector: CSS selector
             
         Returns:
-            Extracted text
+            Text of every matching element, as a list
         """
         if not html:
-            return {"error": "HTML content is required"}
+            return _ERR_HTML_REQUIRED
         
         if not selector:
-            return {"error": "CSS selector is required"}
+            return _ERR_SELECTOR_REQUIRED
         
         try:
-            # Simple implementation - in a real server, use a proper HTML parser
-            import re
+            texts = _css_select(html, selector)
+            if texts is not None:
+                return {"text": texts}
             
-            # Very basic extraction - this is just for demonstration
+            # No HTML parser installed - only the title can be extracted
             if selector == "title":
-                match = re.search(r"<title>(.*?)</title>", html, re.IGNORECASE | re.DOTALL)
-                if match:
-                    return {"text": match.group(1).strip()}
+                title = _find_title(html)
+                return {"text": [] if title is None else [title]}
             
-            return {"text": "Text extraction not fully implemented in this demo"}
+            return _ERR_NO_HTML_PARSER
         except Exception as e:
-            logger.exception(f"Error extracting text: {e}")
+            logger.exception("Error extracting text: %s", e)
             return {"error": str(e)}
     
     def _search_text(
@@ -172,65 +368,252 @@ class WebScraperServer:
             Search results
         """
         if not html:
-            return {"error": "HTML content is required"}
+            return _ERR_HTML_REQUIRED
         
         if not query:
-            return {"error": "Search query is required"}
+            return _ERR_QUERY_REQUIRED
         
         try:
-            # Simple implementation - in a real server, use a proper HTML parser
-            import re
+            # Case-insensitive search, keeping only the first 10 matches
+            found = _compile_query(query).finditer(html)
+            matches = [match.group(0) for match in itertools.islice(found, 10)]
             
-            # Case-insensitive search
-            matches = re.findall(
-                rf"{re.escape(query)}", html, re.IGNORECASE
-            )
+            # Keep counting from where the first 10 matches left off, with the
+            # same matcher so the count agrees with re.IGNORECASE case folding
+            match_count = len(matches) + sum(1 for _ in found)
             
             return {
                 "query": query,
-                "match_count": len(matches),
-                "matches": matches[:10],  # Limit to first 10 matches
+                "match_count": match_count,
+                "matches": matches,
             }
         except Exception as e:
-            logger.exception(f"Error searching text: {e}")
+            logger.exception("Error searching text: %s", e)
             return {"error": str(e)}
 
 
 def main():
     """Main entry point for the server."""
-    server = WebScraperServer()
+    # Configured here rather than at import, so importing the module (as the
+    # tests do) leaves the root logger and the working directory untouched
+    logging.basicConfig(
+        level=os.environ.get("WEBSCRAPER_LOG_LEVEL", "INFO").upper(),
+        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
+        filename="webscraper_server.log",
+    )
+    asyncio.run(_serve(WebScraperServer()))
+
+
+# Largest request accepted; extract_text and search_text carry whole pages
+MAX_REQUEST_BYTES = 32 * 1024 * 1024
+
+_CONTENT_LENGTH = b"content-length:"
+
+
+class _ResponseWriter:
+    """Buffers responses on stdout and flushes once per event-loop turn.
+    
+    Responses finished in the same loop iteration share a single write syscall
+    instead of flushing one at a time.
+    """
+    
+    def __init__(self, loop: asyncio.AbstractEventLoop):
+        """Initialize the writer.
+        
+        Args:
+            loop: Event loop used to schedule flushes
+        """
+        self._loop = loop
+        self._out = open(sys.stdout.fileno(), "wb", buffering=1 << 16, closefd=False)
+        self._flush_scheduled = False
+    
+    def write(self, payload: bytes, framed: bool) -> None:
+        """Queue a response, scheduling a flush if none is pending.
+        
+        Args:
+            payload: Encoded JSON response
+            framed: Whether to send a Content-Length header instead of a
+                trailing newline, matching the request's framing
+        """
+        if framed:
+            self._out.write(b"Content-Length: %d\r\n\r\n" % len(payload))
+            self._out.write(payload)
+        else:
+            self._out.write(payload)
+            self._out.write(b"\n")
+        
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            self._loop.call_soon(self.flush)
+    
+    def flush(self) -> None:
+        """Write out everything buffered so far."""
+        self._flush_scheduled = False
+        self._out.flush()
+
+
+async def _read_message(
+    reader: asyncio.StreamReader,
+) -> Optional[Tuple[Optional[bytes], bool]]:
+    """Read one request from stdin.
+    
+    Requests are either newline-delimited JSON or framed with a
+    ``Content-Length`` header as in MCP/LSP. Framed bodies are read by length,
+    without scanning them for a newline.
+    
+    Args:
+        reader: Stream reader attached to stdin
+        
+    Returns:
+        The request payload and whether it was framed, with a None payload if
+        the request exceeded MAX_REQUEST_BYTES and was skipped; None at EOF.
+        A framed request with a negative or non-integer length is returned as
+        its header line, so it is answered with an invalid JSON error.
+    """
+    try:
+        line = await reader.readline()
+    except ValueError:
+        return None, False
+    
+    if not line:
+        return None
+    if line[:len(_CONTENT_LENGTH)].lower() != _CONTENT_LENGTH:
+        return line, False
+    
+    try:
+        length = int(line[len(_CONTENT_LENGTH):])
+    except ValueError:
+        length = -1
+    
+    # Skip any other headers up to the blank separator line
+    try:
+        while (await reader.readline()).strip():
+            pass
+    except ValueError:
+        return None, True
+    
+    if length < 0:
+        # Without a usable length the body cannot be located; answer the
+        # header itself, which fails to parse as JSON
+        return line, True
     
+    if length > MAX_REQUEST_BYTES:
+        # Discard the body in bounded chunks to stay in sync with the stream
+        while length > 0:
+            chunk = await reader.read(min(length, 1 << 16))
+            if not chunk:
+                break
+            length -= len(chunk)
+        return None, True
+    
+    try:
+        return await reader.readexactly(length), True
+    except asyncio.IncompleteReadError:
+        return None
+
+
+async def _serve(server: WebScraperServer) -> None:
+    """Serve requests from stdin until EOF.
+    
+    Each request runs as its own task, so slow page fetches do not hold up
+    the requests behind them.
+    
+    Args:
+        server: Server handling the requests
+    """
     logger.info("WebScraper server started")
     
-    while True:
-        try:
-            # Read a line from stdin
-            line = sys.stdin.readline()
-            if not line:
+    loop = asyncio.get_running_loop()
+    writer = _ResponseWriter(loop)
+    pending = set()
+    
+    # Read stdin through the event loop in large chunks rather than a
+    # blocking readline() per request
+    reader = asyncio.StreamReader(limit=MAX_REQUEST_BYTES)
+    feeder = None
+    try:
+        await loop.connect_read_pipe(
+            lambda: asyncio.StreamReaderProtocol(reader), sys.stdin
+        )
+    except ValueError:
+        # The loop only watches pipes, sockets and terminals; a regular file
+        # redirected to stdin is read in a worker thread instead
+        feeder = asyncio.create_task(_feed_reader(reader, sys.stdin.buffer))
+    
+    try:
+        while True:
+            message = await _read_message(reader)
+            if message is None:
                 logger.info("Received EOF, exiting")
                 break
             
-            # Parse the JSON request
-            request = json.loads(line)
-            
-            # Handle the request
-            response = server.handle_request(request)
+            payload, framed = message
+            if payload is None:
+                logger.error("Request exceeds %d bytes", MAX_REQUEST_BYTES)
+                writer.write(_ERR_REQUEST_TOO_LARGE.encoded, framed)
+                continue
             
-            # Write the response as JSON
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Invalid JSON: {e}")
-            response = {"error": f"Invalid JSON: {str(e)}"}
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
-            
-        except Exception as e:
-            logger.exception(f"Unexpected error: {e}")
-            response = {"error": f"Server error: {str(e)}"}
-            sys.stdout.write(json.dumps(response) + "\n")
-            sys.stdout.flush()
+            task = asyncio.create_task(_handle_message(server, writer, payload, framed))
+            pending.add(task)
+            task.add_done_callback(pending.discard)
+        
+        if pending:
+            await asyncio.gather(*pending)
+    finally:
+        if feeder is not None:
+            feeder.cancel()
+        writer.flush()
+        await server.aclose()
+
+
+async def _feed_reader(reader: asyncio.StreamReader, stream: BinaryIO) -> None:
+    """Feed a stream reader from a blocking binary stream until EOF.
+    
+    Args:
+        reader: Reader to feed
+        stream: Stream read in a worker thread
+    """
+    loop = asyncio.get_running_loop()
+    while chunk := await loop.run_in_executor(None, stream.read1, 1 << 16):
+        reader.feed_data(chunk)
+    reader.feed_eof()
+
+
+async def _handle_message(
+    server: WebScraperServer, writer: _ResponseWriter, payload: bytes, framed: bool
+) -> None:
+    """Handle one request and write its response.
+    
+    Args:
+        server: Server handling the request
+        writer: Writer for the response
+        payload: JSON-encoded request
+        framed: Whether the request was framed with a Content-Length header
+    """
+    request = None
+    try:
+        # Parse the JSON request
+        request = orjson.loads(payload)
+        
+        # Handle the request
+        response = await server.handle_request(request)
+        
+    except orjson.JSONDecodeError as e:
+        logger.error("Invalid JSON: %s", e)
+        response = {"error": f"Invalid JSON: {str(e)}"}
+        
+    except Exception as e:
+        logger.exception("Unexpected error: %s", e)
+        response = {"error": f"Server error: {str(e)}"}
+    
+    # Responses may complete out of order, so echo the request ID back
+    if isinstance(request, dict) and "id" in request:
+        response = {**response, "id": request["id"]}
+    elif isinstance(response, _StaticResponse):
+        writer.write(response.encoded, framed)
+        return
+    
+    writer.write(orjson.dumps(response), framed)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,7 @@
 """Tests for configuration module."""
 
+import io
+import json
 import os
 import tempfile
 from pathlib import Path
@@ -122,3 +124,54 @@ def test_load_config():
         assert config.api.port == 9000
         assert len(config.mcp.mcp_servers) == 1
         assert config.mcp.mcp_servers[0].name == "TestServer"
+
+
+def test_load_config_from_mapping_and_file():
+    """Test loading configuration from parsed data and file objects."""
+    config_data = {
+        "mcp": {
+            "mcp_servers": [
+                {
+                    "name": "TestServer",
+                    "transport": {
+                        "type": "stdio",
+                        "command": "python",
+                        "args": ["-m", "mcp_server"],
+                    },
+                }
+            ]
+        },
+        "api": {
+            "port": 9000,
+        },
+    }
+    
+    config = load_config(config_data)
+    
+    assert isinstance(config, AppConfig)
+    assert config.api.port == 9000
+    assert config.mcp.mcp_servers[0].name == "TestServer"
+    
+    # File-like objects are parsed as JSON
+    config = load_config(io.StringIO(json.dumps(config_data)))
+    
+    assert config.api.port == 9000
+    assert config.mcp.mcp_servers[0].name == "TestServer"
+
+
+def test_mcp_config_servers_by_name():
+    """Test looking up MCP servers by name."""
+    mcp_config = MCPConfig(
+        mcp_servers=[
+            MCPServerConfig(
+                name="Scheduler",
+                transport=TransportConfig(
+                    type=TransportType.SSE,
+                    url="http://localhost:5146/mcp",
+                ),
+            )
+        ]
+    )
+    
+    assert mcp_config.servers_by_name["Scheduler"].transport.url == "http://localhost:5146/mcp"
+    assert mcp_config.servers_by_name.get("WebScraper") is None
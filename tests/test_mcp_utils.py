@@ -0,0 +1,40 @@
+"""Tests for MCP utility functions."""
+
+import pytest
+
+from app.utils.mcp import MCPRequest, format_mcp_request
+from app.utils.model_mcp import format_mcp_results_for_model
+
+
+def test_format_mcp_request():
+    """Test formatting MCP requests."""
+    request = format_mcp_request("tool", "SearchEngine", "search", {"query": "mcp"})
+    assert request == {
+        "type": "tool",
+        "server": "SearchEngine",
+        "name": "search",
+        "params": {"query": "mcp"},
+    }
+
+    # The ID is only included when provided
+    request = format_mcp_request("resource", "WebScraper", "webpage", request_id="1")
+    assert request["id"] == "1"
+    assert request["params"] == {}
+
+
+def test_mcp_request_invalid_type():
+    """Test that invalid request types are rejected."""
+    with pytest.raises(ValueError):
+        MCPRequest("prompt", "SearchEngine", "search")
+
+
+def test_format_mcp_results_for_model():
+    """Test formatting MCP results for the model."""
+    formatted = format_mcp_results_for_model(
+        {"search": {"results": [1]}, "page": "<html></html>"}
+    )
+    
+    assert formatted.startswith("Here are the results from the MCP requests:")
+    assert '# search\n```json\n{\n  "results": [\n    1\n  ]\n}\n```' in formatted
+    assert "# page\n```\n<html></html>\n```" in formatted
+    assert formatted.endswith("Use this information to formulate your response.")
@@ -0,0 +1,45 @@
+"""Tests for the WebScraper STDIO server."""
+
+import asyncio
+
+import pytest
+
+pytest.importorskip("httpx")
+
+from scripts import webscraper_server
+from scripts.webscraper_server import _css_select, _read_message
+
+
+@pytest.mark.parametrize("length", [b"-1", b"abc"])
+def test_read_message_bad_content_length(length):
+    """Test that an unusable Content-Length does not stop the server loop."""
+    header = b"Content-Length: " + length + b"\r\n"
+    request = b'{"type": "tool", "name": "available_tools"}\n'
+    
+    async def read_all():
+        reader = asyncio.StreamReader()
+        reader.feed_data(header + b"\r\n" + request)
+        reader.feed_eof()
+        
+        messages = []
+        while (message := await _read_message(reader)) is not None:
+            messages.append(message)
+        return messages
+    
+    assert asyncio.run(read_all()) == [(header, True), (request, False)]
+
+
+@pytest.mark.parametrize("backend", ["selectolax", "lxml"])
+def test_css_select_inline_markup(backend, monkeypatch):
+    """Test that both parser backends extract the same text around inline tags."""
+    if backend == "selectolax":
+        pytest.importorskip("selectolax.lexbor")
+        monkeypatch.setattr(webscraper_server, "lxml_html", None)
+    else:
+        pytest.importorskip("lxml.html")
+        pytest.importorskip("cssselect")
+        monkeypatch.setattr(webscraper_server, "HTMLParser", None)
+    
+    html = "<html><body><p> Hello <b>world</b>! </p><p>Bye</p></body></html>"
+    
+    assert _css_select(html, "p") == ["Hello world!", "Bye"]